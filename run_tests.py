@@ -11,23 +11,26 @@ Usage:
     python run_tests.py -v                  # Verbose output
     python run_tests.py --coverage          # Run with coverage report
     python run_tests.py --type unit -v      # Combine options
+    python run_tests.py --jobs 4            # Run on 4 xdist workers (default: auto)
+    python run_tests.py --jobs 1            # Run serially
+    python run_tests.py --lf                # Re-run only tests that failed last time
+    python run_tests.py --ff                # Run last failures first, then the rest
+    python run_tests.py --no-cache          # Disable .pytest_cache (clean CI runs)
+    python run_tests.py --importlib         # Import test modules with --import-mode=importlib
+
+The --lf/--ff flags read pytest's cache in .pytest_cache/ at the repository
+root. CI can persist that directory between jobs (e.g. with actions/cache)
+to keep the last-failed state across runs.
 """
 
 import argparse
+import os
 import sys
 from typing import List, Optional
 
 import pytest
 
-
-# Test type to directory/file mapping
-TEST_PATHS = {
-    "unit": "tests/unit/",
-    "api": "tests/api/",
-    "ui": "tests/ui/",
-    "e2e": "tests/e2e/",
-    "all": "tests/",
-}
+from notebooklm_automator.testing import TEST_PATHS, TestType
 
 
 def build_pytest_args(
@@ -35,6 +38,11 @@ def build_pytest_args(
     verbose: bool = False,
     coverage: bool = False,
     extra_args: Optional[List[str]] = None,
+    jobs: str = "auto",
+    failed_first: bool = False,
+    last_failed: bool = False,
+    no_cache: bool = False,
+    importlib_mode: bool = False,
 ) -> List[str]:
     """Build pytest argument list based on options.
 
@@ -43,6 +51,11 @@ def build_pytest_args(
         verbose: Enable verbose output
         coverage: Enable coverage reporting
         extra_args: Additional pytest arguments
+        jobs: Number of pytest-xdist workers ("auto", "1" disables)
+        failed_first: Run previously failed tests first
+        last_failed: Run only previously failed tests
+        no_cache: Disable the pytest cache provider
+        importlib_mode: Import test modules with --import-mode=importlib
 
     Returns:
         List of pytest arguments
@@ -50,13 +63,34 @@ def build_pytest_args(
     args = []
 
     # Add test path
-    test_path = TEST_PATHS.get(test_type, TEST_PATHS["all"])
+    test_path = TEST_PATHS.get(test_type, TEST_PATHS[TestType.ALL])
     args.append(test_path)
 
+    # Import test modules without prepending their rootdirs to sys.path.
+    # Opt-in: modules relying on that sys.path entry would stop importing
+    if importlib_mode:
+        args.append("--import-mode=importlib")
+
     # Add verbose flag
     if verbose:
         args.append("-v")
 
+    # Run in parallel with pytest-xdist. loadfile keeps tests from one module
+    # on the same worker; e2e tests share a single Playwright session and
+    # always run serially.
+    if jobs != "1" and test_type != "e2e":
+        args.extend(["-n", str(jobs), "--dist=loadfile"])
+
+    # Re-run selection based on the previous run stored in .pytest_cache
+    if last_failed:
+        args.append("--last-failed")
+    if failed_first:
+        args.append("--failed-first")
+
+    # Skip .pytest_cache reads/writes entirely
+    if no_cache:
+        args.extend(["-p", "no:cacheprovider"])
+
     # Add coverage options
     if coverage:
         args.extend([
@@ -77,6 +111,11 @@ def run_tests(
     verbose: bool = False,
     coverage: bool = False,
     extra_args: Optional[List[str]] = None,
+    jobs: str = "auto",
+    failed_first: bool = False,
+    last_failed: bool = False,
+    no_cache: bool = False,
+    importlib_mode: bool = False,
 ) -> int:
     """Run tests using pytest programmatically.
 
@@ -85,11 +124,26 @@ def run_tests(
         verbose: Enable verbose output
         coverage: Enable coverage reporting
         extra_args: Additional pytest arguments
+        jobs: Number of pytest-xdist workers ("auto", "1" disables)
+        failed_first: Run previously failed tests first
+        last_failed: Run only previously failed tests
+        no_cache: Disable the pytest cache provider
+        importlib_mode: Import test modules with --import-mode=importlib
 
     Returns:
         Exit code (0 = success, non-zero = failure)
     """
-    args = build_pytest_args(test_type, verbose, coverage, extra_args)
+    args = build_pytest_args(
+        test_type,
+        verbose,
+        coverage,
+        extra_args,
+        jobs,
+        failed_first=failed_first,
+        last_failed=last_failed,
+        no_cache=no_cache,
+        importlib_mode=importlib_mode,
+    )
     print(f"Running: pytest {' '.join(args)}")
     return pytest.main(args)
 
@@ -112,13 +166,15 @@ Examples:
   python run_tests.py --type unit         Run unit tests only
   python run_tests.py --type api -v       Run API tests with verbose output
   python run_tests.py --coverage          Run all tests with coverage report
+  python run_tests.py -j 1                Run tests serially (no xdist)
+  python run_tests.py --lf                Re-run only last failures
   python run_tests.py -- -k "test_add"    Pass extra args to pytest
         """,
     )
 
     parser.add_argument(
         "--type", "-t",
-        choices=["unit", "api", "ui", "e2e", "all"],
+        choices=[t.value for t in TestType],
         default="all",
         help="Type of tests to run (default: all)",
     )
@@ -132,6 +188,34 @@ Examples:
         action="store_true",
         help="Run with coverage reporting",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        default="auto",
+        help="Number of parallel workers via pytest-xdist (default: auto, 1 = serial)",
+    )
+    parser.add_argument(
+        "--ff", "--failed-first",
+        dest="failed_first",
+        action="store_true",
+        help="Run tests that failed in the last run first",
+    )
+    parser.add_argument(
+        "--lf", "--last-failed",
+        dest="last_failed",
+        action="store_true",
+        help="Run only tests that failed in the last run",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable .pytest_cache (incompatible with --lf/--ff)",
+    )
+    parser.add_argument(
+        "--importlib",
+        dest="importlib_mode",
+        action="store_true",
+        help="Import test modules with --import-mode=importlib instead of prepending to sys.path",
+    )
     parser.add_argument(
         "extra_args",
         nargs="*",
@@ -139,6 +223,8 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.no_cache and (args.failed_first or args.last_failed):
+        parser.error("--no-cache cannot be combined with --lf/--ff")
 
     # Print header
     print("=" * 60)
@@ -146,7 +232,6 @@ Examples:
     print("=" * 60)
     print(f"Test type: {args.type}")
     if args.type == "e2e":
-        import os
         if not os.getenv("NOTEBOOKLM_URL"):
             print("\nWARNING: NOTEBOOKLM_URL not set. E2E tests will be skipped.")
     print()
@@ -157,6 +242,11 @@ Examples:
         verbose=args.verbose,
         coverage=args.coverage,
         extra_args=args.extra_args if args.extra_args else None,
+        jobs=args.jobs,
+        failed_first=args.failed_first,
+        last_failed=args.last_failed,
+        no_cache=args.no_cache,
+        importlib_mode=args.importlib_mode,
     )
 
     # Print summary
@@ -1,25 +1,72 @@
 """FastAPI application for NotebookLM Automator."""
 
 from contextlib import asynccontextmanager
+from urllib.parse import parse_qs
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
-from notebooklm_automator.api.routes import router, get_automator
+from notebooklm_automator.api.routes import (
+    close_automator,
+    close_http_client,
+    close_test_worker,
+    router,
+    start_automator,
+    start_test_worker,
+)
+
+
+# Responses that are already compressed media (audio, PNG screenshots)
+_NO_GZIP_PATH_PREFIXES = ("/audio/download/", "/debug/screenshot")
+
+# Truthy spellings FastAPI accepts for a bool query parameter
+_TRUE_QUERY_VALUES = {"1", "true", "on", "yes", "y", "t"}
+
+
+def _is_streaming_request(scope) -> bool:
+    """Whether the request asks for a line-by-line streamed response.
+
+    GZip buffers output until its block fills, which would hold back the
+    ndjson lines of ``/run-tests?stream=true`` until the run ends.
+    """
+    if scope["path"] != "/run-tests":
+        return False
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return any(v.lower() in _TRUE_QUERY_VALUES for v in query.get("stream", []))
+
+
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip JSON/text responses but pass media and streams through untouched."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (
+            scope["path"].startswith(_NO_GZIP_PATH_PREFIXES)
+            or _is_streaming_request(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown."""
+    await start_automator(app)
+    await start_test_worker()
+
     yield
 
     try:
-        automator = get_automator()
-        automator.close()
+        await close_automator(app)
     except Exception:
         pass
 
+    await close_http_client()
+    await close_test_worker()
+
 
 app = FastAPI(title="NotebookLM Automator API", lifespan=lifespan)
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
 app.include_router(router)
 
 
@@ -1,6 +1,26 @@
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+__all__ = [
+    "SourceType",
+    "Source",
+    "UploadSourcesRequest",
+    "SourceResult",
+    "UploadResponse",
+    "AudioStyle",
+    "AudioDuration",
+    "GenerateAudioRequest",
+    "GenerateAudioResponse",
+    "AudioStatusResponse",
+    "ClearSourcesResponse",
+    "ClearStudioResponse",
+    "DebugStatusResponse",
+    "RunTestsResponse",
+]
+
+# Shared config: ignore unknown keys and store enum members as plain values
+_MODEL_CONFIG = ConfigDict(extra="ignore", use_enum_values=True)
 
 
 class SourceType(str, Enum):
@@ -10,21 +30,29 @@ class SourceType(str, Enum):
 
 
 class Source(BaseModel):
+    model_config = _MODEL_CONFIG
+
     type: SourceType
     content: str  # URL or text content
 
 
 class UploadSourcesRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     sources: List[Source]
 
 
 class SourceResult(BaseModel):
+    model_config = _MODEL_CONFIG
+
     source: Source
     success: bool
     error: Optional[str] = None
 
 
 class UploadResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     overall_success: bool
     results: List[SourceResult]
 
@@ -43,6 +71,8 @@ class AudioDuration(str, Enum):
 
 
 class GenerateAudioRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     style: Optional[AudioStyle] = None
     prompt: Optional[str] = None
     language: Optional[str] = None
@@ -50,11 +80,15 @@ class GenerateAudioRequest(BaseModel):
 
 
 class GenerateAudioResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     job_id: str
     status: str
 
 
 class AudioStatusResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     job_id: str
     status: str  # pending, processing, completed, failed
     title: Optional[str] = None
@@ -63,12 +97,41 @@ class AudioStatusResponse(BaseModel):
 
 
 class ClearSourcesResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     success: bool
     count: int
     message: Optional[str] = None
 
 
 class ClearStudioResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     success: bool
     count: int
     message: Optional[str] = None
+
+
+class DebugStatusResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
+    connected: bool
+    page_url: Optional[str] = None
+    page_title: Optional[str] = None
+    audio_items_count: Optional[int] = None
+    artifact_library_exists: Optional[bool] = None
+    artifact_library_html_preview: Optional[str] = None
+    language: Optional[str] = None
+    debug_info: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class RunTestsResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
+    success: bool
+    test_type: str
+    exit_code: int
+    summary: Dict[str, int]
+    output: str
+    error: Optional[str] = None
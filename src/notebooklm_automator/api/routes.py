@@ -1,53 +1,248 @@
 """API routes for NotebookLM Automator."""
 
+import asyncio
+import collections
+import contextlib
+import functools
+import json
+import logging
 import os
-import subprocess
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+import httpx
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from notebooklm_automator.api.models import (
     AudioStatusResponse,
     ClearSourcesResponse,
     ClearStudioResponse,
+    DebugStatusResponse,
     GenerateAudioRequest,
     GenerateAudioResponse,
+    RunTestsResponse,
+    Source,
     SourceResult,
     UploadResponse,
     UploadSourcesRequest,
 )
 from notebooklm_automator.core.automator import NotebookLMAutomator
+from notebooklm_automator.testing import TEST_PATHS, TestType
+
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-_automator_instance: NotebookLMAutomator = None
+T = TypeVar("T")
 
+# Chunk size used when relaying audio downloads to the client
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-def get_automator() -> NotebookLMAutomator:
-    """Get or create the automator instance."""
-    global _automator_instance
-    if not _automator_instance:
-        url = os.getenv("NOTEBOOKLM_URL")
-        if not url:
-            raise HTTPException(
-                status_code=500,
-                detail="NOTEBOOKLM_URL environment variable not set",
-            )
-        port = int(os.getenv("NOTEBOOKLM_CHROME_PORT", "9222"))
-        _automator_instance = NotebookLMAutomator(notebook_url=url, port=port)
-        try:
-            _automator_instance.connect()
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to connect to NotebookLM: {str(e)}",
-            )
-    return _automator_instance
+# Shared HTTP/2 client so repeated audio downloads reuse pooled connections
+_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=120,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=8),
+)
+
+
+@dataclass(frozen=True)
+class _AutomatorConfig:
+    """Automator settings resolved from the environment once at import."""
+
+    notebook_url: Optional[str]
+    chrome_port: int
+    ws_endpoint: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "_AutomatorConfig":
+        return cls(
+            notebook_url=os.getenv("NOTEBOOKLM_URL"),
+            chrome_port=int(os.getenv("NOTEBOOKLM_CHROME_PORT", "9222")),
+            ws_endpoint=os.getenv("BROWSER_WS_ENDPOINT"),
+        )
+
+
+_CONFIG = _AutomatorConfig.from_env()
+
+# Sync Playwright objects are bound to the thread that created them, so every
+# automator call runs on this one thread while handlers stay on the event loop
+_automator_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="automator")
+
+
+async def _run_automator(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking automator call on the automator thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _automator_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+# The executor serializes single calls; a route's sequence of calls against the
+# shared page additionally holds its notebook's lock so requests don't interleave
+_notebook_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _notebook_lock(automator: NotebookLMAutomator) -> asyncio.Lock:
+    """Return the lock guarding page interactions for the automator's notebook."""
+    lock = _notebook_locks.get(automator.notebook_url)
+    if lock is None:
+        lock = _notebook_locks[automator.notebook_url] = asyncio.Lock()
+    return lock
+
+
+async def _run_locked(
+    automator: NotebookLMAutomator, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a single automator call while holding its notebook's lock."""
+    async with _notebook_lock(automator):
+        return await _run_automator(func, *args, **kwargs)
+
+
+def _create_automator() -> NotebookLMAutomator:
+    """Create and connect the automator."""
+    if not _CONFIG.notebook_url:
+        raise HTTPException(
+            status_code=500,
+            detail="NOTEBOOKLM_URL environment variable not set",
+        )
+    automator = NotebookLMAutomator(
+        notebook_url=_CONFIG.notebook_url, port=_CONFIG.chrome_port
+    )
+    try:
+        automator.connect()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to connect to NotebookLM: {str(e)}",
+        )
+    return automator
 
 
-@router.get("/debug/status")
-def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
-    """Debug endpoint to check current page status."""
+async def start_automator(app: FastAPI) -> None:
+    """Connect the shared automator at startup and store it on app.state.
+
+    A failed connection is logged rather than raised so the API still
+    starts; get_automator() retries on the first request that needs it.
+    """
+    app.state.automator = None
+    app.state.automator_lock = asyncio.Lock()
+    try:
+        app.state.automator = await _run_automator(_create_automator)
+    except HTTPException as e:
+        logger.warning("Automator not connected at startup: %s", e.detail)
+
+
+async def get_automator(request: Request) -> NotebookLMAutomator:
+    """Return the shared automator, connecting it first if needed."""
+    state = request.app.state
+    if state.automator is None:
+        async with state.automator_lock:
+            if state.automator is None:
+                state.automator = await _run_automator(_create_automator)
+    return state.automator
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client used for audio downloads."""
+    await _http_client.aclose()
+
+
+async def close_automator(app: FastAPI) -> None:
+    """Close the shared automator if it was created."""
+    automator = getattr(app.state, "automator", None)
+    app.state.automator = None
+    if automator is not None:
+        await _run_automator(automator.close)
+
+
+# Collects every DOM-derived debug value in one CDP round-trip instead of
+# one locator call per selector
+_DEBUG_STATUS_JS = """(opts) => {
+    const lib = document.querySelector('artifact-library');
+    const result = {
+        artifactLibraryExists: lib !== null,
+        audioCount: lib ? lib.children.length : 0,
+        viewport: {width: window.innerWidth, height: window.innerHeight},
+    };
+    if (opts.verbose) {
+        const count = (sel) => document.querySelectorAll(sel).length;
+        result.altSelectors = {
+            '.artifact-library-container': count('.artifact-library-container'),
+            "[class*='artifact']": count("[class*='artifact']"),
+            "[class*='audio']": count("[class*='audio']"),
+            "mat-icon:has-text('play_arrow')": Array.from(
+                document.querySelectorAll('mat-icon')
+            ).filter((el) => el.textContent.includes('play_arrow')).length,
+            "[class*='studio']": count("[class*='studio']"),
+            "[class*='overview']": count("[class*='overview']"),
+            'button': count('button'),
+        };
+    }
+    if (opts.includeHtml && lib) {
+        result.artifactHtml = lib.innerHTML.slice(0, 500);
+    }
+    if (opts.includeBodyText && document.body) {
+        result.bodyText = document.body.innerText.slice(0, 1000);
+    }
+    return result;
+}"""
+
+
+@router.get("/debug/status", response_model=DebugStatusResponse)
+async def debug_status(
+    verbose: bool = False,
+    include_html: bool = False,
+    include_body_text: bool = False,
+    debug_tabs: bool = False,
+    automator: NotebookLMAutomator = Depends(get_automator),
+):
+    """Debug endpoint to check current page status.
+
+    Args:
+        verbose: Also report alternative selector match counts.
+        include_html: Include a preview of the artifact-library inner HTML.
+        include_body_text: Include a preview of the page body text.
+        debug_tabs: Also check which selectors match the Studio tab.
+    """
+    return await _run_locked(
+        automator,
+        _collect_debug_status,
+        automator,
+        verbose=verbose,
+        include_html=include_html,
+        include_body_text=include_body_text,
+        debug_tabs=debug_tabs,
+    )
+
+
+def _collect_debug_status(
+    automator: NotebookLMAutomator,
+    verbose: bool,
+    include_html: bool,
+    include_body_text: bool,
+    debug_tabs: bool,
+) -> dict:
     try:
         automator.ensure_connected()
         page = automator.page
@@ -61,63 +256,44 @@ def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
         debug_info = {}
 
         try:
-            # Debug: Check if Studio tab exists using different selectors
-            studio_text = automator._get_text("studio_tab")
-            debug_info["studio_tab_text"] = studio_text
-
-            # Check various tab selectors
-            mat_tab = page.locator(f".mat-mdc-tab:has-text('{studio_text}')").first
-            role_tab = page.locator(f"[role='tab']:has-text('{studio_text}')").first
-            text_match = page.get_by_text(studio_text, exact=True).first
-
-            debug_info["studio_tab_selectors"] = {
-                "mat_mdc_tab": mat_tab.count() > 0,
-                "role_tab": role_tab.count() > 0,
-                "text_match": text_match.count() > 0,
-            }
+            if debug_tabs:
+                # Debug: Check if Studio tab exists using different selectors.
+                # :has-text() is Playwright-only, so these stay locator calls.
+                studio_text = automator._get_text("studio_tab")
+                debug_info["studio_tab_text"] = studio_text
+
+                # Check various tab selectors
+                mat_tab = page.locator(f".mat-mdc-tab:has-text('{studio_text}')").first
+                role_tab = page.locator(f"[role='tab']:has-text('{studio_text}')").first
+                text_match = page.get_by_text(studio_text, exact=True).first
+
+                debug_info["studio_tab_selectors"] = {
+                    "mat_mdc_tab": mat_tab.count() > 0,
+                    "role_tab": role_tab.count() > 0,
+                    "text_match": text_match.count() > 0,
+                }
 
             # Ensure we're on Studio tab before checking audio elements
             automator._audio_manager._ensure_studio_tab()
 
-            # Check if artifact-library exists
-            parent = page.locator("artifact-library")
-            artifact_library_exists = parent.count() > 0
-
-            if artifact_library_exists:
-                children = parent.locator(":scope > *")
-                audio_count = children.count()
-                # Get first 500 chars of inner HTML for debugging
-                try:
-                    artifact_library_html = parent.inner_html()[:500]
-                except Exception:
-                    artifact_library_html = "Could not get HTML"
-
-            # Try alternative selectors
-            alt_selectors = {
-                ".artifact-library-container": page.locator(".artifact-library-container").count(),
-                "[class*='artifact']": page.locator("[class*='artifact']").count(),
-                "[class*='audio']": page.locator("[class*='audio']").count(),
-                "mat-icon:has-text('play_arrow')": page.locator("mat-icon:has-text('play_arrow')").count(),
-                # Additional selectors for debugging
-                "[class*='studio']": page.locator("[class*='studio']").count(),
-                "[class*='overview']": page.locator("[class*='overview']").count(),
-                "button": page.locator("button").count(),
-            }
-            debug_info["alternative_selectors"] = alt_selectors
-
-            # Get body text snippet for context
-            try:
-                body_text = page.locator("body").inner_text()[:1000]
-                debug_info["page_text_preview"] = body_text
-            except Exception:
-                pass
+            stats = page.evaluate(
+                _DEBUG_STATUS_JS,
+                {
+                    "verbose": verbose,
+                    "includeHtml": include_html,
+                    "includeBodyText": include_body_text,
+                },
+            )
+            artifact_library_exists = stats["artifactLibraryExists"]
+            audio_count = stats["audioCount"]
+            artifact_library_html = stats.get("artifactHtml", "")
+            if verbose:
+                debug_info["alternative_selectors"] = stats["altSelectors"]
+            if "bodyText" in stats:
+                debug_info["page_text_preview"] = stats["bodyText"]
 
             # Get viewport size for debugging layout issues
-            try:
-                viewport = page.viewport_size
-                debug_info["viewport"] = viewport
-            except Exception:
-                pass
+            debug_info["viewport"] = stats["viewport"]
 
         except Exception as e:
             debug_info["selector_error"] = str(e)
@@ -140,7 +316,7 @@ def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.get("/debug/screenshot")
-def debug_screenshot(
+async def debug_screenshot(
     save: bool = False,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
@@ -150,14 +326,12 @@ def debug_screenshot(
         save: If True, save to /app/local/cookies/screenshot.png (viewable on host)
     """
     try:
-        automator.ensure_connected()
-        screenshot = automator.page.screenshot(full_page=False)
+        screenshot = await _run_locked(automator, _take_screenshot, automator)
 
         if save:
             # Save to mounted volume for viewing on host
             save_path = "/app/local/cookies/screenshot.png"
-            with open(save_path, "wb") as f:
-                f.write(screenshot)
+            await asyncio.to_thread(Path(save_path).write_bytes, screenshot)
             return {"saved": True, "path": save_path, "size": len(screenshot)}
 
         return Response(
@@ -169,24 +343,40 @@ def debug_screenshot(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _take_screenshot(automator: NotebookLMAutomator) -> bytes:
+    automator.ensure_connected()
+    return automator.page.screenshot(full_page=False)
+
+
 @router.post("/sources/upload", response_model=UploadResponse)
-def upload_sources(
+async def upload_sources(
     request: UploadSourcesRequest,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Upload one or more sources to the notebook."""
-    sources_data = [s.model_dump() for s in request.sources]
-    results_data = automator.add_sources(sources_data)
-
-    results = [SourceResult(**r) for r in results_data]
+    sources_data = request.model_dump()["sources"]
+    results_data = await _run_locked(automator, automator.add_sources, sources_data)
+
+    # Results are built by the automator from already-validated sources,
+    # so construct the response models without a second validation pass
+    results = [
+        SourceResult.model_construct(
+            source=Source.model_construct(**r["source"]),
+            success=r["success"],
+            error=r["error"],
+        )
+        for r in results_data
+    ]
     overall_success = all(r.success for r in results)
-    return UploadResponse(overall_success=overall_success, results=results)
+    return UploadResponse.model_construct(
+        overall_success=overall_success, results=results
+    )
 
 
 @router.post("/sources/clear", response_model=ClearSourcesResponse)
-def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
+async def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
     """Clear all sources from the notebook."""
-    result = automator.clear_sources()
+    result = await _run_locked(automator, automator.clear_sources)
     return ClearSourcesResponse(
         success=result.get("success", False),
         count=result.get("count", 0),
@@ -195,17 +385,19 @@ def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.post("/audio/generate", response_model=GenerateAudioResponse)
-def generate_audio(
+async def generate_audio(
     request: GenerateAudioRequest,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Trigger audio generation."""
     try:
-        job_id = automator.generate_audio(
-            style=request.style.value if request.style else None,
+        job_id = await _run_locked(
+            automator,
+            automator.generate_audio,
+            style=request.style,
             language=request.language,
             prompt=request.prompt,
-            duration=request.duration.value if request.duration else None,
+            duration=request.duration,
         )
         return GenerateAudioResponse(job_id=job_id, status="started")
     except Exception as e:
@@ -213,16 +405,19 @@ def generate_audio(
 
 
 @router.get("/audio/status/{job_id}", response_model=AudioStatusResponse)
-def check_audio_status(
+async def check_audio_status(
     job_id: str,
+    response: Response,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Check the status of audio generation."""
-    status_data = automator.get_audio_status(job_id)
-
+    # Matches the automator's status TTL so intermediate caches absorb polling
+    response.headers["Cache-Control"] = "max-age=1"
     download_url = None
-    if status_data["status"] == "completed":
-        download_url = automator.get_download_url(job_id)
+    async with _notebook_lock(automator):
+        status_data = await _run_automator(automator.get_audio_status, job_id)
+        if status_data["status"] == "completed":
+            download_url = await _run_automator(automator.get_download_url, job_id)
 
     return AudioStatusResponse(
         job_id=job_id,
@@ -233,19 +428,20 @@ def check_audio_status(
 
 
 @router.get("/audio/file/{job_id}")
-def get_audio_download_url(
+async def get_audio_download_url(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Return the direct download URL for generated audio."""
-    status_data = automator.get_audio_status(job_id)
-    if status_data["status"] != "completed":
-        raise HTTPException(
-            status_code=400,
-            detail="Audio generation not completed or failed",
-        )
+    async with _notebook_lock(automator):
+        status_data = await _run_automator(automator.get_audio_status, job_id)
+        if status_data["status"] != "completed":
+            raise HTTPException(
+                status_code=400,
+                detail="Audio generation not completed or failed",
+            )
 
-    url = automator.get_download_url(job_id)
+        url = await _run_automator(automator.get_download_url, job_id)
     if not url:
         raise HTTPException(
             status_code=500,
@@ -256,85 +452,109 @@ def get_audio_download_url(
 
 
 @router.get("/audio/download/{job_id}")
-def download_audio_file(
+async def download_audio_file(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Download audio file as binary data.
 
     Returns the actual audio file content as binary data.
-    In browserless mode, downloads via HTTP from the captured URL.
-    In CDP mode, uses filesystem-based download.
+    In browserless mode, streams the file via HTTP from the captured URL.
+    In CDP mode, serves the downloaded file from disk and deletes it afterwards.
     """
-    import requests
-    from urllib.parse import quote
+    async with _notebook_lock(automator):
+        status_data = await _run_automator(automator.get_audio_status, job_id)
 
-    status_data = automator.get_audio_status(job_id)
+        if status_data["status"] != "completed":
+            raise HTTPException(
+                status_code=400,
+                detail="Audio generation not completed or failed",
+            )
 
-    if status_data["status"] != "completed":
-        raise HTTPException(
-            status_code=400,
-            detail="Audio generation not completed or failed",
-        )
+        if _CONFIG.ws_endpoint:
+            url = await _run_automator(automator.get_download_url, job_id)
+        else:
+            # CDP mode: download by clicking Download button in UI
+            result = await _run_automator(automator.download_audio_file, job_id)
 
     # Check if using browserless (WebSocket) mode
-    ws_endpoint = os.getenv("BROWSER_WS_ENDPOINT")
-
-    if ws_endpoint:
-        # Browserless mode: download via HTTP from captured URL
-        url = automator.get_download_url(job_id)
+    if _CONFIG.ws_endpoint:
+        # Browserless mode: stream via HTTP from captured URL
         if not url:
             raise HTTPException(
                 status_code=500,
                 detail="Could not retrieve download URL",
             )
 
+        resp = None
         try:
-            resp = requests.get(url, timeout=120)
+            resp = await _http_client.send(
+                _http_client.build_request("GET", url), stream=True
+            )
             resp.raise_for_status()
-            content = resp.content
-            file_size = len(content)
-            # Extract filename from URL or use default
-            file_name = f"audio_{job_id}.mp4"
         except Exception as e:
+            if resp is not None:
+                await resp.aclose()
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to download audio from URL: {str(e)}",
             )
-    else:
-        # CDP mode: download by clicking Download button in UI
-        result = automator.download_audio_file(job_id)
 
-        if not result:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to download audio file",
-            )
+        headers = {"Content-Disposition": _content_disposition(f"audio_{job_id}.mp4")}
+        content_length = resp.headers.get("Content-Length")
+        if content_length:
+            headers["Content-Length"] = content_length
+
+        async def iter_audio():
+            try:
+                async for chunk in resp.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                await resp.aclose()
+
+        return StreamingResponse(
+            iter_audio(),
+            media_type="audio/mp4",
+            headers=headers,
+        )
+
+    if not result:
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to download audio file",
+        )
 
-        content, file_name, file_size = result
+    file_path, file_name, _ = result
 
+    # Serve straight from disk and delete the download once it has been sent
+    return FileResponse(
+        file_path,
+        media_type="audio/mp4",
+        headers={"Content-Disposition": _content_disposition(file_name)},
+        background=BackgroundTask(_remove_file, file_path),
+    )
+
+
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+def _content_disposition(file_name: str) -> str:
+    """Build an attachment Content-Disposition header for a file name."""
     encoded_filename = quote(file_name, safe='')
 
     # Provide both ASCII fallback and UTF-8 encoded filename
-    content_disposition = (
+    return (
         f"attachment; filename=\"{encoded_filename}\"; "
         f"filename*=UTF-8''{encoded_filename}"
     )
 
-    return Response(
-        content=content,
-        media_type="audio/mp4",
-        headers={
-            "Content-Disposition": content_disposition,
-            "Content-Length": str(file_size),
-        },
-    )
-
 
 @router.post("/studio/clear", response_model=ClearStudioResponse)
-def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
+async def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
     """Delete all generated audio items."""
-    result = automator.clear_studio()
+    result = await _run_locked(automator, automator.clear_studio)
     return ClearStudioResponse(
         success=result.get("success", False),
         count=result.get("count", 0),
@@ -343,7 +563,7 @@ def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.post("/auth/save")
-def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
+async def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
     """Save current browser login state to storage_state.json.
 
     This captures cookies and localStorage from the current browser session.
@@ -358,8 +578,7 @@ def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
     3. Future sessions will use storage_state.json automatically
     """
     try:
-        automator.ensure_connected()
-        success = automator.save_login_state()
+        success = await _run_locked(automator, _save_login_state, automator)
 
         if success:
             return {
@@ -376,60 +595,250 @@ def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Test type to directory mapping
-TEST_PATHS = {
-    "unit": "tests/unit/",
-    "api": "tests/api/",
-    "ui": "tests/ui/",
-    "e2e": "tests/e2e/",
-    "all": "tests/",
-}
+def _save_login_state(automator: NotebookLMAutomator) -> bool:
+    automator.ensure_connected()
+    return automator.save_login_state()
+
+
+# Matches counts in a pytest summary line, e.g. "1 failed, 5 passed, 2 errors"
+_SUMMARY_RE = re.compile(r"(\d+)\s*(passed|failed|skipped|error)", re.IGNORECASE)
+
+# The summary is always within the last few KB of pytest output
+_SUMMARY_TAIL_CHARS = 4096
+
+# Bytes kept from pytest's stderr; older output is dropped
+_TEST_OUTPUT_LIMIT = 1 << 20
+
+# Read size used when draining the pytest pipes
+_TEST_READ_SIZE = 64 * 1024
+
+# Trailing stdout lines kept and returned as the run's output
+_TEST_TAIL_LINES = 1024
+
+# Longest single stdout line the pipe reader will buffer
+_TEST_LINE_LIMIT = 1 << 20
+
+# Seconds before a test run is killed
+_TEST_TIMEOUT = 300
+
+# Idle pytest worker that has already imported pytest, ready for the next run
+_standby_worker: Optional[asyncio.subprocess.Process] = None
+
+
+async def _spawn_pytest_worker() -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "notebooklm_automator.testing.worker",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_TEST_LINE_LIMIT,
+    )
+
+
+async def _take_pytest_worker() -> asyncio.subprocess.Process:
+    """Hand out the warm worker (or a fresh one) and start its replacement."""
+    global _standby_worker
+    proc, _standby_worker = _standby_worker, None
+    if proc is None or proc.returncode is not None:
+        proc = await _spawn_pytest_worker()
+    _standby_worker = await _spawn_pytest_worker()
+    return proc
+
+
+async def start_test_worker() -> None:
+    """Spawn the idle pytest worker at startup so the first run is warm too.
+
+    A failed spawn is logged rather than raised; _take_pytest_worker() starts
+    a fresh worker on demand.
+    """
+    global _standby_worker
+    if _standby_worker is not None and _standby_worker.returncode is None:
+        return
+    try:
+        _standby_worker = await _spawn_pytest_worker()
+    except OSError as e:
+        logger.warning("Could not pre-start the pytest worker: %s", e)
+
 
+async def close_test_worker() -> None:
+    """Stop the idle pytest worker, if one is running."""
+    global _standby_worker
+    proc, _standby_worker = _standby_worker, None
+    if proc is not None and proc.returncode is None:
+        proc.kill()
+        await proc.wait()
 
-@router.post("/run-tests")
-def run_tests(test_type: str = "all", verbose: bool = False):
+
+async def _drain(stream: asyncio.StreamReader, limit: int = _TEST_OUTPUT_LIMIT) -> str:
+    """Read a pipe to EOF, keeping only the last ``limit`` bytes.
+
+    Args:
+        stream: Subprocess stdout or stderr
+        limit: Maximum number of trailing bytes to keep
+
+    Returns:
+        The retained output, decoded as UTF-8
+    """
+    chunks: Deque[bytes] = collections.deque()
+    size = 0
+    while True:
+        chunk = await stream.read(_TEST_READ_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        while size - len(chunks[0]) >= limit:
+            size -= len(chunks.popleft())
+    return b"".join(chunks)[-limit:].decode("utf-8", errors="replace")
+
+
+async def _read_lines(
+    stream: asyncio.StreamReader,
+    on_line: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> str:
+    """Read a pipe line by line, keeping the last ``_TEST_TAIL_LINES`` lines.
+
+    Args:
+        stream: Subprocess stdout
+        on_line: Optional coroutine called with every line as it arrives
+
+    Returns:
+        The retained tail, joined with newlines
+    """
+    tail: Deque[str] = collections.deque(maxlen=_TEST_TAIL_LINES)
+    async for raw in stream:
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        tail.append(line)
+        if on_line is not None:
+            await on_line(line)
+    return "\n".join(tail)
+
+
+async def _run_pytest(
+    args: List[str],
+    timeout: float,
+    on_line: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> Tuple[int, str, str]:
+    """Run pytest in a pre-warmed subprocess and capture the tail of its output.
+
+    Args:
+        args: pytest command-line arguments
+        timeout: Seconds to wait before killing the run
+        on_line: Optional coroutine called with each stdout line
+
+    Returns:
+        Tuple of (exit_code, stdout tail, stderr)
+    """
+    proc = await _take_pytest_worker()
+    try:
+        proc.stdin.write(json.dumps(args).encode("utf-8") + b"\n")
+        await proc.stdin.drain()
+        proc.stdin.close()
+        stdout, stderr, exit_code = await asyncio.wait_for(
+            asyncio.gather(
+                _read_lines(proc.stdout, on_line),
+                _drain(proc.stderr),
+                proc.wait(),
+            ),
+            timeout=timeout,
+        )
+    except BaseException:
+        # Timed out or the request was cancelled: don't leave pytest running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    return exit_code, stdout, stderr
+
+
+def _ndjson(record: dict) -> bytes:
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+async def _stream_pytest(args: List[str], test_type: TestType) -> AsyncIterator[bytes]:
+    """Yield a test run as NDJSON: one {"line"} record per stdout line, then
+    a final record with the same fields as the non-streaming response."""
+    lines: "asyncio.Queue[str]" = asyncio.Queue(maxsize=_TEST_TAIL_LINES)
+    run = asyncio.ensure_future(_run_pytest(args, _TEST_TIMEOUT, on_line=lines.put))
+    try:
+        while True:
+            get_line = asyncio.ensure_future(lines.get())
+            await asyncio.wait({get_line, run}, return_when=asyncio.FIRST_COMPLETED)
+            if get_line.done():
+                yield _ndjson({"line": get_line.result()})
+                continue
+            get_line.cancel()
+            if lines.empty():
+                break
+
+        try:
+            exit_code, output, error = run.result()
+        except asyncio.TimeoutError:
+            yield _ndjson({"error": "Test execution timed out after 5 minutes"})
+            return
+        except Exception as e:
+            yield _ndjson({"error": f"Failed to run tests: {str(e)}"})
+            return
+
+        yield _ndjson({
+            "success": exit_code == 0,
+            "test_type": test_type.value,
+            "exit_code": exit_code,
+            "summary": _parse_test_summary(output),
+            "error": error if error else None,
+        })
+    finally:
+        run.cancel()
+
+
+@router.post("/run-tests", response_model=RunTestsResponse)
+async def run_tests(
+    test_type: TestType = TestType.ALL,
+    verbose: bool = False,
+    stream: bool = False,
+):
     """Trigger the test suite.
 
     Args:
         test_type: Type of tests to run (unit, api, ui, e2e, all). Default: all
         verbose: Enable verbose output. Default: False
+        stream: Stream output lines as NDJSON while the run is in progress.
+            Default: False
 
     Returns:
-        JSON with success status, output, errors, and test summary.
+        JSON with success status, the last 1024 lines of output, errors,
+        and test summary.
     """
-    if test_type not in TEST_PATHS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid test_type. Must be one of: {', '.join(TEST_PATHS.keys())}",
-        )
-
     test_path = TEST_PATHS[test_type]
 
-    # Build pytest command
-    cmd = ["python", "-m", "pytest", test_path]
+    # Build pytest arguments
+    args = [test_path]
     if verbose:
-        cmd.append("-v")
+        args.append("-v")
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
+    if stream:
+        return StreamingResponse(
+            _stream_pytest(args, test_type),
+            media_type="application/x-ndjson",
         )
 
+    try:
+        exit_code, output, error = await _run_pytest(args, timeout=_TEST_TIMEOUT)
+
         # Parse test summary from output
-        summary = _parse_test_summary(result.stdout)
+        summary = _parse_test_summary(output)
 
         return {
-            "success": result.returncode == 0,
-            "test_type": test_type,
-            "exit_code": result.returncode,
+            "success": exit_code == 0,
+            "test_type": test_type.value,
+            "exit_code": exit_code,
             "summary": summary,
-            "output": result.stdout,
-            "error": result.stderr if result.stderr else None,
+            "output": output,
+            "error": error if error else None,
         }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         raise HTTPException(
             status_code=504,
             detail="Test execution timed out after 5 minutes",
@@ -459,33 +868,22 @@ def _parse_test_summary(output: str) -> dict:
     }
 
     # Look for summary line like "5 passed, 2 failed, 1 skipped"
-    lines = output.split("\n")
-    for line in reversed(lines):
-        line_lower = line.lower()
-        if "passed" in line_lower or "failed" in line_lower:
-            import re
-
-            # Extract numbers
-            passed = re.search(r"(\d+)\s*passed", line_lower)
-            failed = re.search(r"(\d+)\s*failed", line_lower)
-            skipped = re.search(r"(\d+)\s*skipped", line_lower)
-            errors = re.search(r"(\d+)\s*error", line_lower)
-
-            if passed:
-                summary["passed"] = int(passed.group(1))
-            if failed:
-                summary["failed"] = int(failed.group(1))
-            if skipped:
-                summary["skipped"] = int(skipped.group(1))
-            if errors:
-                summary["errors"] = int(errors.group(1))
-
-            summary["total"] = (
-                summary["passed"]
-                + summary["failed"]
-                + summary["skipped"]
-                + summary["errors"]
-            )
-            break
+    tail = output[-_SUMMARY_TAIL_CHARS:]
+    for line in reversed(tail.splitlines()):
+        matches = _SUMMARY_RE.findall(line)
+        if not any(kind.lower() in ("passed", "failed") for _, kind in matches):
+            continue
+
+        for count, kind in matches:
+            kind = kind.lower()
+            summary["errors" if kind == "error" else kind] = int(count)
+
+        summary["total"] = (
+            summary["passed"]
+            + summary["failed"]
+            + summary["skipped"]
+            + summary["errors"]
+        )
+        break
 
     return summary
@@ -1,14 +1,193 @@
 """Audio generation and retrieval operations for NotebookLM Automator."""
 
 import logging
+import os
 import time
-from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TYPE_CHECKING
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from watchfiles import watch
 
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
 logger = logging.getLogger(__name__)
 
+# Reads everything get_status() needs about one artifact-library item in a
+# single CDP round-trip. Title selectors are tried in order, first visible
+# non-empty match wins; visibility mirrors Playwright's is_visible().
+_ITEM_STATUS_JS = """(index) => {
+    const items = document.querySelectorAll('artifact-library > *');
+    const item = items[index];
+    if (!item) {
+        return null;
+    }
+    const isVisible = (el) => el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+
+    let title = null;
+    const titleSelectors = [
+        '.artifact-title',
+        'span.artifact-title',
+        '.artifact-labels .artifact-title',
+        '.artifact-labels div span',
+        'span.mat-title-small',
+    ];
+    for (const selector of titleSelectors) {
+        const el = item.querySelector(selector);
+        if (el && isVisible(el)) {
+            const text = el.innerText.trim();
+            if (text) {
+                title = text;
+                break;
+            }
+        }
+    }
+
+    const playIconVisible = Array.from(item.querySelectorAll('mat-icon')).some(
+        (el) => el.textContent.includes('play_arrow') && isVisible(el)
+    );
+
+    return {text: item.innerText, title, playIconVisible};
+}"""
+
+# Stops the player once its URL is known: pausing halts playback and
+# dropping the source aborts the in-flight media fetch.
+_STOP_MEDIA_JS = """() => {
+    for (const media of document.querySelectorAll('audio, video')) {
+        media.pause();
+        media.removeAttribute('src');
+        media.load();
+    }
+}"""
+
+# Clients poll job status every second or two; back-to-back polls within the
+# TTL reuse the last reading. Completed jobs are terminal and kept until the
+# item list is changed through this manager.
+_STATUS_TTL = 1.0
+_STATUS_CACHE_SIZE = 512
+
+
+def _find_new_download(download_dir: str, files_before: Set[str]) -> Optional[str]:
+    """Return the first finished file in download_dir not in files_before."""
+    try:
+        files_now = os.listdir(download_dir)
+    except OSError as e:
+        logger.debug("Error listing dir: %s", e)
+        return None
+
+    for f in files_now:
+        # Chrome writes to <name>.crdownload and renames it when done
+        if f in files_before or f.endswith(".crdownload") or f.startswith("."):
+            continue
+        filepath = os.path.join(download_dir, f)
+        if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
+            logger.info("Found new file: %s", f)
+            return filepath
+    return None
+
+
+def _wait_for_stable_size(path: str, interval: float = 0.2, timeout: float = 5.0) -> None:
+    """Wait until the file size stops changing between two checks."""
+    deadline = time.monotonic() + timeout
+    try:
+        size = os.path.getsize(path)
+        while time.monotonic() < deadline:
+            time.sleep(interval)
+            new_size = os.path.getsize(path)
+            if new_size == size:
+                return
+            size = new_size
+    except OSError:
+        pass
+
+
+def _wait_for_download(
+    download_dir: str, files_before: Set[str], timeout: float
+) -> Optional[str]:
+    """Block until a new finished download appears in download_dir.
+
+    Wakes on filesystem notifications (inotify on Linux) and rescans at
+    least once a second, which also covers shared volumes that do not
+    deliver events. Falls back to plain polling if no watcher can start.
+    """
+    deadline = time.monotonic() + timeout
+    found = _find_new_download(download_dir, files_before)
+
+    if not found:
+        try:
+            for _ in watch(
+                download_dir,
+                debounce=50,
+                step=50,
+                rust_timeout=1000,
+                yield_on_timeout=True,
+                recursive=False,
+            ):
+                found = _find_new_download(download_dir, files_before)
+                if found or time.monotonic() >= deadline:
+                    break
+        except Exception as e:
+            logger.debug("File watcher unavailable (%s), polling instead", e)
+            # Back off from 25ms up to 500ms so a quick download is noticed early
+            delay = 0.025
+            while not found and time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                found = _find_new_download(download_dir, files_before)
+
+    if found:
+        _wait_for_stable_size(found)
+    return found
+
+
+@dataclass(frozen=True)
+class _AudioSelectors:
+    """Localized texts and CSS selectors, built once per UI language."""
+
+    studio_tab_text: str
+    studio_tab: str
+    generate_button: str
+    prompt_textarea: str
+    generating_text: str
+    error_text: str
+    play_button: str
+    close_player_button: str
+    more_button: str
+    download_menu_text: str
+    delete_menu_text: str
+    confirm_delete_text: str
+
+    @classmethod
+    def from_text(cls, get_text: Callable[[str], str]) -> "_AudioSelectors":
+        studio_text = get_text("studio_tab")
+        return cls(
+            studio_tab_text=studio_text,
+            studio_tab=(
+                f".mat-mdc-tab:has-text('{studio_text}'), "
+                f".mat-tab-label:has-text('{studio_text}'), "
+                f"[role='tab']:has-text('{studio_text}')"
+            ),
+            generate_button=(
+                f"mat-dialog-actions button:has-text('{get_text('generate_button')}')"
+            ),
+            prompt_textarea=(
+                f"textarea[placeholder*='{get_text('prompt_textarea_placeholder')}']"
+            ),
+            generating_text=get_text("generating_status_text"),
+            error_text=get_text("error_text"),
+            play_button=f"button[aria-label='{get_text('play_arrow_button')}']",
+            close_player_button=(
+                f"button[aria-label='{get_text('close_audio_player_button')}']"
+            ),
+            more_button=f"button[aria-label='{get_text('more_button')}']",
+            download_menu_text=get_text("download_menu_item"),
+            delete_menu_text=get_text("delete_menu_item"),
+            confirm_delete_text=get_text("confirm_delete_button"),
+        )
+
 
 class AudioManager:
     """Manages audio generation and retrieval for a NotebookLM page."""
@@ -16,6 +195,24 @@ class AudioManager:
     def __init__(self, page: "Page", get_text: Callable[[str], str]):
         self.page = page
         self._get_text = get_text
+        # The language is fixed for the lifetime of a manager
+        self._sel = _AudioSelectors.from_text(get_text)
+        self._status_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._completed_status: Dict[str, Dict[str, str]] = {}
+
+    def _invalidate_status_cache(self) -> None:
+        """Drop cached statuses; job IDs are item positions and may shift."""
+        self._status_cache.clear()
+        self._completed_status.clear()
+
+    @staticmethod
+    def _wait_for_state(locator, state: str, timeout: float) -> bool:
+        """Wait for a locator to reach a state; return False on timeout."""
+        try:
+            locator.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
     def _close_any_dialog(self) -> None:
         """Close any open dialog that might block tab clicks."""
@@ -29,12 +226,12 @@ class AudioManager:
                 ).first
                 if close_btn.count() > 0 and close_btn.is_visible():
                     close_btn.click()
-                    self.page.wait_for_timeout(200)
+                    self._wait_for_state(dialog, "hidden", 1000)
                     return
 
                 # Fallback: press Escape
                 self.page.keyboard.press("Escape")
-                self.page.wait_for_timeout(200)
+                self._wait_for_state(dialog, "hidden", 1000)
         except Exception:
             pass
 
@@ -48,25 +245,20 @@ class AudioManager:
         self._close_any_dialog()
 
         # Try to click Studio tab using Angular Material tab selector
-        studio_text = self._get_text("studio_tab")
         # Priority 1: mat-tab-label with text (Angular Material tabs)
-        studio_tab = self.page.locator(
-            f".mat-mdc-tab:has-text('{studio_text}'), "
-            f".mat-tab-label:has-text('{studio_text}'), "
-            f"[role='tab']:has-text('{studio_text}')"
-        ).first
+        studio_tab = self.page.locator(self._sel.studio_tab).first
         if studio_tab.count() > 0 and studio_tab.is_visible():
             logger.info("Switching to Studio tab...")
             studio_tab.click()
-            self.page.wait_for_timeout(500)
+            self._wait_for_state(parent, "attached", 2000)
             return
 
         # Priority 2: fallback to text matching
-        studio_tab = self.page.get_by_text(studio_text, exact=True).first
+        studio_tab = self.page.get_by_text(self._sel.studio_tab_text, exact=True).first
         if studio_tab.count() > 0 and studio_tab.is_visible():
             logger.info("Switching to Studio tab (text match)...")
             studio_tab.click()
-            self.page.wait_for_timeout(500)
+            self._wait_for_state(parent, "attached", 2000)
 
     def generate(
         self,
@@ -134,10 +326,7 @@ class AudioManager:
                     logger.warning(f"Could not find duration button: {duration}")
 
         if prompt:
-            placeholder_snippet = self._get_text("prompt_textarea_placeholder")
-            textarea = self.page.locator(
-                f"textarea[placeholder*='{placeholder_snippet}']"
-            )
+            textarea = self.page.locator(self._sel.prompt_textarea)
 
             if not textarea.is_visible():
                 textarea = self.page.locator(
@@ -146,12 +335,14 @@ class AudioManager:
             if textarea.is_visible():
                 textarea.fill(prompt)
 
-        generate_btn = self.page.locator(
-            f"mat-dialog-actions button:has-text('{self._get_text('generate_button')}')"
-        ).last
+        generate_btn = self.page.locator(self._sel.generate_button).last
         if not generate_btn.is_visible():
             generate_btn = self.page.locator("mat-dialog-actions button").last
 
+        items = self.page.locator(".artifact-library-container")
+        count_before = items.count()
+
+        self._invalidate_status_cache()
         generate_btn.click()
 
         try:
@@ -161,21 +352,22 @@ class AudioManager:
         except Exception:
             pass
 
-        time.sleep(2)
+        # Wait for the new item to show up rather than sleeping a fixed 2s
+        try:
+            self.page.wait_for_function(
+                "(n) => document.querySelectorAll('.artifact-library-container').length > n",
+                arg=count_before,
+                timeout=2000,
+            )
+        except PlaywrightTimeoutError:
+            pass
 
-        items = self.page.locator(".artifact-library-container")
         count = items.count()
 
         return str(count)
 
     def _reset_download_behavior(self):
         """Reset Chrome's download behavior to normal."""
-        try:
-            # Remove any active route handlers
-            self.page.unroute("**/*")
-        except Exception:
-            pass
-
         try:
             # Reset download behavior via CDP
             cdp = self.page.context.new_cdp_session(self.page)
@@ -186,29 +378,31 @@ class AudioManager:
         except Exception:
             pass
 
-    def _get_item_title(self, item) -> Optional[str]:
-        """Extract title from an artifact-library-item element."""
-        try:
-            # Try multiple selectors for maximum compatibility
-            title_selectors = [
-                ".artifact-title",
-                "span.artifact-title",
-                ".artifact-labels .artifact-title",
-                ".artifact-labels div span",
-                "span.mat-title-small",
-            ]
-            for selector in title_selectors:
-                title_el = item.locator(selector).first
-                if title_el.count() > 0 and title_el.is_visible():
-                    title = title_el.inner_text().strip()
-                    if title:
-                        return title
-            return None
-        except Exception:
-            return None
-
     def get_status(self, job_id: str) -> Dict[str, str]:
         """Check the status of an audio generation job."""
+        completed = self._completed_status.get(job_id)
+        if completed is not None:
+            return dict(completed)
+
+        now = time.monotonic()
+        cached = self._status_cache.get(job_id)
+        if cached is not None and now - cached[0] < _STATUS_TTL:
+            return dict(cached[1])
+
+        status = self._read_status(job_id)
+        if status["status"] == "completed":
+            self._status_cache.pop(job_id, None)
+            self._completed_status[job_id] = status
+        else:
+            self._status_cache.pop(job_id, None)
+            if len(self._status_cache) >= _STATUS_CACHE_SIZE:
+                # Entries are re-inserted on refresh, so the first is the oldest
+                self._status_cache.pop(next(iter(self._status_cache)))
+            self._status_cache[job_id] = (now, status)
+        return dict(status)
+
+    def _read_status(self, job_id: str) -> Dict[str, str]:
+        """Read the status of an audio generation job from the page."""
         self._ensure_studio_tab()
 
         try:
@@ -216,30 +410,24 @@ class AudioManager:
         except ValueError:
             return {"status": "unknown", "error": "Invalid job_id format"}
 
-        parent = self.page.locator("artifact-library")
-        children = parent.locator(":scope > *")
-        count = children.count()
-
-        if count <= index:
+        if index < 0:
             return {"status": "unknown", "error": "Job ID not found"}
 
-        item = children.nth(index)
-        text_content = item.inner_text()
+        item = self.page.evaluate(_ITEM_STATUS_JS, index)
+        if item is None:
+            return {"status": "unknown", "error": "Job ID not found"}
 
-        # Extract title
-        title = self._get_item_title(item)
+        text_content = item["text"]
+        title = item["title"]
 
-        generating_text = self._get_text("generating_status_text")
-        if "sync" in text_content or generating_text in text_content:
+        if "sync" in text_content or self._sel.generating_text in text_content:
             return {"status": "generating", "title": title}
 
-        if "play_arrow" in text_content or item.locator(
-            "mat-icon:has-text('play_arrow')"
-        ).is_visible():
+        if "play_arrow" in text_content or item["playIconVisible"]:
             return {"status": "completed", "title": title}
 
-        error_text = self._get_text("error_text")
-        if "error" in text_content.lower() or error_text in text_content.lower():
+        text_lower = text_content.lower()
+        if "error" in text_lower or self._sel.error_text in text_lower:
             return {"status": "failed", "title": title}
 
         return {"status": "unknown", "title": title}
@@ -268,9 +456,7 @@ class AudioManager:
         except Exception:
             pass
 
-        play_btn = item.locator(
-            f"button[aria-label='{self._get_text('play_arrow_button')}']"
-        ).first
+        play_btn = item.locator(self._sel.play_button).first
 
         if not play_btn.is_visible():
             logger.error("Play button not found for job %s", job_id)
@@ -281,70 +467,48 @@ class AudioManager:
         except Exception:
             pass
 
-        captured_url: Dict[str, Optional[str]] = {"value": None}
-
-        def route_handler(route, request):
-            try:
-                if captured_url["value"] is None and request.resource_type == "media":
-                    captured_url["value"] = request.url
-                    route.abort("blockedbyclient")
-                    return
-            except Exception:
-                pass
-
-            try:
-                route.continue_()
-            except Exception:
-                pass
-
-        pattern = "**/*"
-
+        # Only the URL is needed; the player's first media request carries it
+        media_url = None
         try:
-            self.page.route(pattern, route_handler)
-
-            try:
+            with self.page.expect_request(
+                lambda request: request.resource_type == "media", timeout=5000
+            ) as request_info:
                 play_btn.click()
-            except Exception as click_error:
-                logger.error(
-                    "Failed to click play for job %s: %s", job_id, click_error
-                )
-                return None
+            media_url = request_info.value.url
+        except PlaywrightTimeoutError:
+            pass
+        except Exception as click_error:
+            logger.error(
+                "Failed to click play for job %s: %s", job_id, click_error
+            )
+            return None
 
-            timeout_seconds = 5
-            start_time = time.time()
-            while (
-                captured_url["value"] is None
-                and (time.time() - start_time) < timeout_seconds
-            ):
-                self.page.wait_for_timeout(100)
-        finally:
-            try:
-                self.page.unroute(pattern, route_handler)
-            except Exception:
-                pass
+        try:
+            self.page.evaluate(_STOP_MEDIA_JS)
+        except Exception as e:
+            logger.debug("Could not stop the audio player: %s", e)
 
         try:
-            if captured_url["value"]:
-                close_player_button = self.page.locator(
-                    f"button[aria-label='{self._get_text('close_audio_player_button')}']"
-                )
+            if media_url:
+                close_player_button = self.page.locator(self._sel.close_player_button)
                 if close_player_button.is_visible():
                     close_player_button.first.click()
-                return captured_url["value"]
+                return media_url
 
             logger.error("Failed to capture media URL for job %s", job_id)
             return None
         except Exception:
             return None
 
-    def download_file(self, job_id: str) -> Optional[Tuple[bytes, str, int]]:
+    def download_file(self, job_id: str) -> Optional[Tuple[str, str, int]]:
         """Download audio by clicking download and waiting for file.
 
+        The file is left in the download directory; the caller is
+        responsible for removing it once it has been served.
+
         Returns:
-            Tuple of (file_content, file_name, file_size) or None if failed.
+            Tuple of (file_path, file_name, file_size) or None if failed.
         """
-        import os
-
         self._ensure_studio_tab()
 
         try:
@@ -376,22 +540,18 @@ class AudioManager:
             except Exception:
                 pass
 
-            more_btn = item.locator(
-                f"button[aria-label='{self._get_text('more_button')}']"
-            ).first
+            more_btn = item.locator(self._sel.more_button).first
 
             if not more_btn.is_visible():
                 logger.error("More button not found")
                 return None
 
             more_btn.click()
-            self.page.wait_for_timeout(500)
 
-            download_text = self._get_text("download_menu_item")
             download_menu = self.page.get_by_role(
-                "menuitem", name=download_text).first
+                "menuitem", name=self._sel.download_menu_text).first
 
-            if not download_menu.is_visible():
+            if not self._wait_for_state(download_menu, "visible", 2000):
                 logger.error("Download menu not found")
                 self.page.keyboard.press("Escape")
                 return None
@@ -403,61 +563,28 @@ class AudioManager:
 
             # Wait for NEW file to appear in download folder
             logger.info("Waiting for file in %s...", download_dir)
-            timeout = 120
-            start_time = time.time()
-            downloaded_file = None
-
-            while time.time() - start_time < timeout:
-                try:
-                    files_now = set(os.listdir(download_dir))
-                    new_files = files_now - files_before
-
-                    for f in new_files:
-                        if f.endswith(".crdownload") or f.startswith("."):
-                            continue
-                        filepath = os.path.join(download_dir, f)
-                        if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
-                            downloaded_file = filepath
-                            logger.info("Found new file: %s", f)
-                            break
-                except Exception as e:
-                    logger.debug("Error listing dir: %s", e)
-
-                if downloaded_file:
-                    time.sleep(1)  # Ensure write complete
-                    break
-                time.sleep(0.5)
+            downloaded_file = _wait_for_download(download_dir, files_before, timeout=120)
 
             if not downloaded_file:
-                logger.error("Download timed out. Files before: %s, Files now: %s",
-                             files_before, files_now if 'files_now' in dir() else 'unknown')
+                logger.error("Download timed out. Files before: %s", files_before)
                 return None
 
-            # Read the file
-            with open(downloaded_file, "rb") as f:
-                body = f.read()
-                file_name = os.path.basename(downloaded_file)
-                file_size = os.path.getsize(downloaded_file)
-
-            logger.info("Downloaded %d bytes from %s",
-                        len(body), downloaded_file)
+            file_name = os.path.basename(downloaded_file)
+            file_size = os.path.getsize(downloaded_file)
 
-            # Cleanup - delete only the file we downloaded
-            try:
-                os.remove(downloaded_file)
-            except Exception:
-                pass
+            logger.info("Downloaded %d bytes to %s",
+                        file_size, downloaded_file)
 
-            return body, file_name, file_size
+            return downloaded_file, file_name, file_size
 
         except Exception as e:
             logger.error("Download failed: %s", e)
-            import traceback
             traceback.print_exc()
             return None
 
     def clear_studio(self) -> Dict[str, Any]:
         """Delete all generated audio items."""
+        self._invalidate_status_cache()
         self._ensure_studio_tab()
 
         removed = 0
@@ -466,38 +593,45 @@ class AudioManager:
             return {"success": False, "count": 0, "message": "No generated items found"}
 
         max_attempts = 200
+        handles = []
+        fresh = False
         for _ in range(max_attempts):
-            items = parent.locator(":scope > *")
-            count = items.count()
-            if count == 0:
-                break
+            if not handles:
+                # Resolve all items in one round-trip; only re-query once the
+                # batch is used up or a handle turns out to be stale
+                handles = parent.locator(":scope > *").element_handles()
+                if not handles:
+                    break
+                fresh = True
 
-            item = items.first
+            # Only the first item of a new batch is known to be current;
+            # the list may re-render after each delete
+            item = handles.pop(0)
+            is_fresh, fresh = fresh, False
             try:
-                item.scroll_into_view_if_needed(timeout=2000)
-            except Exception:
-                pass
+                try:
+                    item.scroll_into_view_if_needed(timeout=2000)
+                except Exception:
+                    pass
 
-            more_btn = item.locator(
-                f"button[aria-label='{self._get_text('more_button')}']"
-            ).first
+                more_btn = item.query_selector(self._sel.more_button)
+                if more_btn is None or not more_btn.is_visible():
+                    raise RuntimeError("more options button not found")
 
-            if more_btn.count() == 0 or not more_btn.is_visible():
-                logger.warning(
-                    "Could not locate more options for generated item.")
-                break
-
-            try:
                 more_btn.click()
             except Exception as e:
-                logger.error(f"Failed to open menu for generated item: {e}")
+                if not is_fresh:
+                    handles = []
+                    continue
+                logger.warning(
+                    f"Could not open more options for generated item: {e}")
                 break
 
             delete_menu = self.page.get_by_role(
-                "menuitem", name=self._get_text("delete_menu_item")
+                "menuitem", name=self._sel.delete_menu_text
             ).first
 
-            if delete_menu.count() == 0 or not delete_menu.is_visible():
+            if not self._wait_for_state(delete_menu, "visible", 2000):
                 logger.warning(
                     "Delete option not found in generated item menu.")
                 break
@@ -505,20 +639,21 @@ class AudioManager:
             delete_menu.click()
 
             confirm_button = self.page.get_by_role(
-                "button", name=self._get_text("confirm_delete_button")
+                "button", name=self._sel.confirm_delete_text
             ).first
 
-            if confirm_button.count() == 0 or not confirm_button.is_visible():
+            if not self._wait_for_state(confirm_button, "visible", 2000):
                 logger.warning("Delete confirmation button not found.")
                 break
 
             try:
                 confirm_button.click()
-                item.wait_for(state="detached", timeout=2000)
+                # "hidden" is also satisfied once the item is detached
+                item.wait_for_element_state("hidden", timeout=2000)
             except Exception as e:
                 logger.warning(f"Generated item did not delete cleanly: {e}")
+                handles = []
 
             removed += 1
-            self.page.wait_for_timeout(300)
 
         return {"success": removed > 0, "count": removed}
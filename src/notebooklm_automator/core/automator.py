@@ -1,21 +1,26 @@
 """Main automator class for Google NotebookLM."""
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
-
-from playwright.sync_api import sync_playwright, Error as PlaywrightError
+import threading
+import time
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import os
 
 from notebooklm_automator.core.browser import ChromeManager, get_chrome_host
 from notebooklm_automator.core.cookies import (
-    get_auth_state,
     has_chrome_login_state,
+    load_auth_state,
+    reload_env as reload_cookies_env,
     save_storage_state,
 )
-from notebooklm_automator.core.selectors import get_selector_by_language
+from notebooklm_automator.core.selectors import make_selector_getter
 from notebooklm_automator.core.sources import SourceManager
-from notebooklm_automator.core.audio import AudioManager
+
+# Playwright (and the audio module, which pulls it and watchfiles in) is only
+# imported once a connection is made, so importing the package stays cheap
+if TYPE_CHECKING:
+    from notebooklm_automator.core.audio import AudioManager
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,6 +28,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Present once the notebook UI has rendered, in both the full layout and the
+# narrow tab layout
+_APP_READY_SELECTOR = (
+    "artifact-library, div.single-source-container, .mat-mdc-tab, [role='tab']"
+)
+
+# Reads the UI language and whether the notebook UI has rendered in one
+# round-trip
+_PAGE_META_JS = f"""() => ({{
+    lang: document.documentElement.lang,
+    ready: document.querySelector("{_APP_READY_SELECTOR}") !== null,
+}})"""
+
 
 class NotebookLMAutomator:
     """
@@ -32,6 +50,44 @@ class NotebookLMAutomator:
     adding sources, and generating audio.
     """
 
+    # Minimum seconds between page round-trip liveness probes
+    _PROBE_INTERVAL = 2.0
+
+    # One Playwright driver (a node subprocess) shared by all instances and
+    # stopped when the last instance holding it closes
+    _pw_singleton: ClassVar[Optional[Any]] = None
+    _pw_refcount: ClassVar[int] = 0
+    _pw_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Large enough for NotebookLM's full layout (requires width > 1051 for
+    # non-tab mode, height > 640 for audio visibility)
+    _VIEWPORT: ClassVar[Dict[str, int]] = {"width": 1280, "height": 800}
+
+    # Connection settings read from the environment once; see reload_env()
+    _ws_endpoint: ClassVar[Optional[str]] = None
+    _chrome_host: ClassVar[str] = "127.0.0.1"
+    _google_account_email: ClassVar[Optional[str]] = None
+
+    # Google account chooser selectors
+    _CHOOSE_ACCOUNT_SELECTOR = "text=Choose an account"
+    # Google uses div[data-identifier] with role="link" for account items;
+    # the li:has(...) alternative matches by email text in the list
+    _ACCOUNT_SELECTOR_TEMPLATE = (
+        "div[data-identifier='{email}'], li:has(div[data-email='{email}'])"
+    )
+    _FIRST_ACCOUNT_SELECTOR = "div[data-identifier][role='link']"
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """Re-read BROWSER_WS_ENDPOINT, NOTEBOOKLM_CHROME_HOST and GOOGLE_ACCOUNT_EMAIL.
+
+        Also refreshes the auth-file environment variables cached by cookies.py.
+        """
+        reload_cookies_env()
+        cls._ws_endpoint = os.getenv("BROWSER_WS_ENDPOINT")
+        cls._chrome_host = get_chrome_host()
+        cls._google_account_email = os.getenv("GOOGLE_ACCOUNT_EMAIL")
+
     def __init__(self, notebook_url: str, port: int = 9222):
         """
         Initialize the automator.
@@ -44,31 +100,48 @@ class NotebookLMAutomator:
         self.port = port
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
         self.lang = "en"
+        self._get_selector = make_selector_getter(self.lang)
         self._chrome_manager = ChromeManager(port)
         self._source_manager: Optional[SourceManager] = None
-        self._audio_manager: Optional[AudioManager] = None
+        self._audio_manager: Optional["AudioManager"] = None
+        self._last_probe = 0.0
+        # has_chrome_login_state() result, kept until close()
+        self._chrome_login_state_checked: Optional[bool] = None
 
     def connect(self) -> None:
         """Connect to the browser and navigate to the notebook."""
         if self.page and not self.page.is_closed():
             return
 
-        if self.playwright:
-            try:
-                self.playwright.stop()
-            except Exception:
-                pass
-            self.playwright = None
-
-        self.playwright = sync_playwright().start()
+        from playwright.sync_api import Error as PlaywrightError
 
         # Check if using WebSocket endpoint (browserless) or CDP
-        ws_endpoint = os.getenv("BROWSER_WS_ENDPOINT")
+        ws_endpoint = self._ws_endpoint
+
+        # If only the page went away, keep the browser connection and its
+        # context (caches, service workers, cookies) instead of starting over
+        context = self._reusable_context()
+        if context is not None:
+            logger.info("Reusing existing browser context")
+        else:
+            if self.browser:
+                try:
+                    self.browser.close()
+                except Exception:
+                    pass
+                self.browser = None
+
+            if self.playwright is None:
+                self.playwright = self._acquire_playwright()
+
+        # Set when a new context was created with the auth state preinstalled
+        state_installed = False
 
         try:
-            if ws_endpoint:
+            if context is None and ws_endpoint:
                 # Connect via WebSocket (browserless/chrome)
                 logger.info(f"Connecting to browserless via: {ws_endpoint}")
 
@@ -80,20 +153,25 @@ class NotebookLMAutomator:
                 )
                 logger.info("Successfully connected to browserless")
 
-                # Set viewport size large enough for NotebookLM full layout
-                # (requires width > 1051 for non-tab mode, height > 640 for audio visibility)
+                # Set viewport size large enough for NotebookLM full layout;
+                # browserless has no persistent state, so bootstrap the context
+                # with the stored cookies and localStorage in one step
+                auth_state = load_auth_state()
                 context = self.browser.new_context(
-                    viewport={"width": 1280, "height": 800}
+                    viewport=self._VIEWPORT,
+                    storage_state=auth_state,
                 )
-            else:
+                state_installed = auth_state is not None
+            elif context is None:
                 # Connect via CDP (local Chrome)
-                chrome_host = get_chrome_host()
+                chrome_host = self._chrome_host
                 logger.info(f"Connecting to Chrome via CDP on {chrome_host}:{self.port}...")
                 self._chrome_manager.ensure_running(chrome_host)
                 self.browser = self.playwright.chromium.connect_over_cdp(
                     f"http://{chrome_host}:{self.port}"
                 )
                 context = self.browser.contexts[0]
+            self.context = context
 
             # Prefer existing NotebookLM page over creating new one (CDP mode only)
             existing_page = None
@@ -108,45 +186,52 @@ class NotebookLMAutomator:
                 logger.info("Reusing existing NotebookLM page")
             else:
                 # Inject auth state if needed
-                # WebSocket mode: always inject (browserless has no persistent state)
+                # WebSocket mode: inject into a reused context (new contexts
+                # already got it via storage_state)
                 # CDP mode: only inject if Chrome doesn't have existing login state
-                should_inject = ws_endpoint or not has_chrome_login_state()
+                should_inject = not state_installed and (
+                    ws_endpoint or not self._has_chrome_login_state()
+                )
                 if should_inject:
-                    auth_state = get_auth_state()
-                    if auth_state:
+                    state = load_auth_state()
+                    if state:
                         try:
-                            # auth_state can be a file path (str) or dict
-                            if isinstance(auth_state, str):
-                                # Load from file path
-                                import json
-                                with open(auth_state, "r") as f:
-                                    state = json.load(f)
-                            else:
-                                state = auth_state
-
                             # Add cookies from storage state
                             cookies = state.get("cookies", [])
-                            if cookies:
+                            if cookies and self._has_google_session(context):
+                                logger.info("Context already has a Google session, skipping injection")
+                            elif cookies:
                                 context.add_cookies(cookies)
                                 logger.info(f"Injected {len(cookies)} cookies from storage state")
                         except Exception as e:
                             logger.warning(f"Failed to inject auth state: {e}")
-                else:
+                elif not state_installed:
                     logger.info("Chrome already has login state, skipping injection")
 
                 self.page = context.new_page()
-                self.page.set_viewport_size({"width": 1280, "height": 800})
+                # Contexts created above already carry the viewport; skip the
+                # emulation round-trip unless it differs
+                if self.page.viewport_size != self._VIEWPORT:
+                    self.page.set_viewport_size(self._VIEWPORT)
                 logger.info(f"Navigating to {self.notebook_url}...")
-                self.page.goto(self.notebook_url, timeout=10000)
-                try:
-                    self.page.wait_for_load_state("networkidle", timeout=10000)
-                except PlaywrightError:
-                    logger.warning("Network idle timeout, continuing anyway...")
+                # NotebookLM keeps the network busy, so waiting for networkidle
+                # only ever ran into its timeout; gate on the rendered UI instead
+                self.page.goto(
+                    self.notebook_url, timeout=10000, wait_until="domcontentloaded"
+                )
 
                 # Handle Google account chooser if present
                 self._handle_account_chooser()
 
-            self._detect_language()
+                try:
+                    self.page.wait_for_selector(
+                        _APP_READY_SELECTOR, state="attached", timeout=10000
+                    )
+                except PlaywrightError:
+                    logger.warning("Notebook UI wait timed out, continuing anyway...")
+
+            if not self._detect_language():
+                logger.warning("Notebook UI not rendered yet, continuing anyway...")
             self._init_managers()
             logger.info(f"Connected. Detected language: {self.lang}")
 
@@ -155,13 +240,65 @@ class NotebookLMAutomator:
             self.close()
             raise
 
+    @classmethod
+    def _acquire_playwright(cls):
+        """Take a reference to the shared Playwright driver, starting it if needed."""
+        with cls._pw_lock:
+            if cls._pw_singleton is None:
+                from playwright.sync_api import sync_playwright
+
+                cls._pw_singleton = sync_playwright().start()
+            cls._pw_refcount += 1
+            return cls._pw_singleton
+
+    @classmethod
+    def _release_playwright(cls) -> None:
+        """Drop a reference to the shared driver, stopping it at zero."""
+        with cls._pw_lock:
+            cls._pw_refcount -= 1
+            if cls._pw_refcount > 0:
+                return
+            playwright, cls._pw_singleton, cls._pw_refcount = cls._pw_singleton, None, 0
+        if playwright is not None:
+            playwright.stop()
+
+    def _has_chrome_login_state(self) -> bool:
+        """Check the Chrome profile for login state once per session."""
+        if self._chrome_login_state_checked is None:
+            self._chrome_login_state_checked = has_chrome_login_state()
+        return self._chrome_login_state_checked
+
+    @staticmethod
+    def _has_google_session(context) -> bool:
+        """Check whether the context already carries a Google SID cookie."""
+        existing = context.cookies(urls=["https://notebooklm.google.com"])
+        return any(c["name"] == "SID" for c in existing)
+
+    def _reusable_context(self):
+        """Return the current context if its browser is still connected."""
+        if self.context is None or self.browser is None:
+            return None
+        try:
+            if self.browser.is_connected() and self.context in self.browser.contexts:
+                return self.context
+        except Exception:
+            pass
+        return None
+
     def ensure_connected(self) -> None:
         """Ensure the automation is connected to the browser."""
         try:
             if not self.page or self.page.is_closed():
                 self.connect()
-            else:
+            elif (
+                time.monotonic() - self._last_probe >= self._PROBE_INTERVAL
+                or not self.browser.is_connected()
+            ):
                 self.page.evaluate("1+1")
+            else:
+                # Probed recently and the browser connection is still up
+                return
+            self._last_probe = time.monotonic()
         except Exception:
             logger.info("Connection lost, reconnecting...")
             self.connect()
@@ -207,15 +344,17 @@ class NotebookLMAutomator:
 
         try:
             if self.playwright:
-                self.playwright.stop()
+                self._release_playwright()
         except Exception:
             pass
 
         self.page = None
+        self.context = None
         self.browser = None
         self.playwright = None
         self._source_manager = None
         self._audio_manager = None
+        self._chrome_login_state_checked = None
         self._chrome_manager.terminate()
 
     def _handle_account_chooser(self) -> None:
@@ -226,68 +365,60 @@ class NotebookLMAutomator:
                 return
 
             # Look for "Choose an account" text or similar
-            choose_account = self.page.locator("text=Choose an account")
+            choose_account = self.page.locator(self._CHOOSE_ACCOUNT_SELECTOR)
             if choose_account.count() == 0:
                 return
 
             logger.info("Account chooser detected, selecting account...")
 
             # Get preferred account from env var
-            preferred_account = os.getenv("GOOGLE_ACCOUNT_EMAIL")
+            preferred_account = self._google_account_email
 
             if preferred_account:
-                # Click on the account with matching email
-                # Google uses div[data-identifier] with role="link" for account items
+                # Click on the account with matching email, checking both
+                # forms of the account item in a single query
                 account_item = self.page.locator(
-                    f"div[data-identifier='{preferred_account}']"
+                    self._ACCOUNT_SELECTOR_TEMPLATE.format(email=preferred_account)
                 ).first
                 if account_item.count() > 0:
                     logger.info(f"Selecting account: {preferred_account}")
-                    account_item.click()
                 else:
-                    # Fallback: try matching by email text in the list
-                    account_item = self.page.locator(
-                        f"li:has(div[data-email='{preferred_account}'])"
-                    ).first
-                    if account_item.count() > 0:
-                        logger.info(f"Selecting account (fallback): {preferred_account}")
-                        account_item.click()
-                    else:
-                        logger.warning(
-                            f"Account {preferred_account} not found in chooser"
-                        )
-                        return
+                    logger.warning(
+                        f"Account {preferred_account} not found in chooser"
+                    )
+                    return
             else:
                 # No preferred account, click the first available account
                 # Account items are div elements with data-identifier attribute
-                first_account = self.page.locator(
-                    "div[data-identifier][role='link']"
-                ).first
-                if first_account.count() > 0:
+                account_item = self.page.locator(self._FIRST_ACCOUNT_SELECTOR).first
+                if account_item.count() > 0:
                     logger.info("No preferred account set, selecting first account")
-                    first_account.click()
                 else:
                     logger.warning("No accounts found in chooser")
                     return
 
-            # Wait for navigation after account selection
-            self.page.wait_for_timeout(2000)
-            try:
-                self.page.wait_for_load_state("networkidle", timeout=10000)
-            except PlaywrightError:
-                pass
+            # Return as soon as the selected account's redirect has loaded
+            with self.page.expect_navigation(
+                wait_until="domcontentloaded", timeout=10000
+            ):
+                account_item.click()
 
             logger.info(f"Account selected, now at: {self.page.url}")
 
         except Exception as e:
             logger.warning(f"Failed to handle account chooser: {e}")
 
-    def _detect_language(self) -> None:
-        """Detect the UI language from the page."""
+    def _detect_language(self) -> bool:
+        """Detect the UI language from the page.
+
+        Returns:
+            Whether the notebook UI had rendered when the language was read.
+        """
         try:
-            lang_attr = self.page.evaluate("document.documentElement.lang")
+            meta = self.page.evaluate(_PAGE_META_JS)
+            lang_attr = meta["lang"]
             if lang_attr:
-                if lang_attr.startswith("he") or lang_attr.startswith("iw"):
+                if lang_attr.startswith(("he", "iw")):
                     self.lang = "he"
                 elif lang_attr.startswith("zh"):
                     self.lang = "zh"
@@ -295,17 +426,24 @@ class NotebookLMAutomator:
                     self.lang = "ja"
                 else:
                     self.lang = "en"
+            return meta["ready"]
         except Exception:
             self.lang = "en"
+            return False
 
-    def _get_text(self, key: str) -> str:
+    def _get_text(self, key: str) -> Optional[str]:
         """Get localized text for a selector key."""
-        return get_selector_by_language(self.lang, key)
+        return self._get_selector(key)
 
     def _init_managers(self) -> None:
         """Initialize source and audio managers after page is ready."""
-        self._source_manager = SourceManager(self.page, self._get_text)
-        self._audio_manager = AudioManager(self.page, self._get_text)
+        from notebooklm_automator.core.audio import AudioManager
+
+        # Resolve the detected language's selectors once and hand the
+        # managers a lookup specialized for it
+        self._get_selector = make_selector_getter(self.lang)
+        self._source_manager = SourceManager(self.page, self._get_selector)
+        self._audio_manager = AudioManager(self.page, self._get_selector)
 
     def add_sources(self, sources: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
@@ -378,7 +516,7 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._audio_manager.get_download_url(job_id)
 
-    def download_audio_file(self, job_id: str) -> Optional[Tuple[bytes, str, int]]:
+    def download_audio_file(self, job_id: str) -> Optional[Tuple[str, str, int]]:
         """
         Download the audio file by clicking Download in the UI.
 
@@ -386,7 +524,8 @@ class NotebookLMAutomator:
             job_id: The job ID of the audio to download.
 
         Returns:
-            Tuple of (file_content, file_name, file_size) or None if failed.
+            Tuple of (file_path, file_name, file_size) or None if failed.
+            The caller owns the file at file_path and should delete it.
         """
         self.ensure_connected()
         return self._audio_manager.download_file(job_id)
@@ -401,3 +540,6 @@ class NotebookLMAutomator:
         self.ensure_connected()
         self._source_manager.close_dialog()
         return self._audio_manager.clear_studio()
+
+
+NotebookLMAutomator.reload_env()
@@ -4,15 +4,20 @@ import os
 import logging
 import platform
 import shutil
+import socket
 import subprocess
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-import requests
-
 logger = logging.getLogger(__name__)
 
+# Keep-alive session for the DevTools endpoint, which ensure_running() polls;
+# created on first use so importing this module doesn't pull in requests
+_CDP_SESSION = None
+
 
 def get_chrome_host() -> str:
     """Get the Chrome host from environment or default."""
@@ -21,16 +26,45 @@ def get_chrome_host() -> str:
 
 def is_cdp_available(host: str, port: int) -> bool:
     """Check if Chrome DevTools Protocol is available at the given host and port."""
+    # A bare TCP connect is enough to rule out a port nobody is listening on
+    try:
+        socket.create_connection((host, port), timeout=0.2).close()
+    except OSError:
+        return False
+
+    import requests
+
+    global _CDP_SESSION
+    if _CDP_SESSION is None:
+        _CDP_SESSION = requests.Session()
+
     try:
-        requests.get(f"http://{host}:{port}/json/version", timeout=1)
+        _CDP_SESSION.get(f"http://{host}:{port}/json/version", timeout=1)
         return True
     except requests.RequestException:
         return False
 
 
+def _reap(process: subprocess.Popen, timeout: float) -> None:
+    """Wait for a terminated process to exit, killing it after the timeout."""
+    try:
+        process.wait(timeout=timeout)
+    except Exception:
+        try:
+            process.kill()
+            process.wait()
+        except Exception:
+            pass
+
+
 def resolve_chrome_binary() -> Optional[str]:
     """Find the Chrome binary path based on OS and environment."""
-    configured_path = os.getenv("NOTEBOOKLM_CHROME_PATH")
+    return _resolve_chrome_binary(os.getenv("NOTEBOOKLM_CHROME_PATH"))
+
+
+@lru_cache(maxsize=4)
+def _resolve_chrome_binary(configured_path: Optional[str]) -> Optional[str]:
+    """Search for Chrome once per NOTEBOOKLM_CHROME_PATH value."""
     if configured_path and Path(configured_path).exists():
         return configured_path
 
@@ -74,19 +108,22 @@ class ChromeManager:
         self._started_browser = False
 
     def terminate(self) -> None:
-        """Terminate the Chrome process if it was started by this manager."""
+        """Terminate the Chrome process if it was started by this manager.
+
+        Returns right after signalling Chrome; a daemon thread waits for it
+        to exit and kills it if it is still running after 5 seconds.
+        """
         if self.chrome_process and self._started_browser:
+            process = self.chrome_process
+            self.chrome_process = None
+            self._started_browser = False
             try:
-                self.chrome_process.terminate()
-                self.chrome_process.wait(timeout=5)
+                process.terminate()
             except Exception:
-                try:
-                    self.chrome_process.kill()
-                except Exception:
-                    pass
-            finally:
-                self.chrome_process = None
-                self._started_browser = False
+                pass
+            threading.Thread(
+                target=_reap, args=(process, 5), name="chrome-reaper", daemon=True
+            ).start()
 
     def ensure_running(self, host: str) -> None:
         """Ensure Chrome is running with remote debugging enabled."""
@@ -140,12 +177,15 @@ class ChromeManager:
         )
         self._started_browser = True
 
-        deadline = time.time() + 20
-        while time.time() < deadline:
+        # Back off from 10ms up to 500ms so a fast start is noticed quickly
+        delay = 0.01
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline:
             if is_cdp_available(host, self.port):
                 logger.info("Started Chrome with remote debugging automatically.")
                 return
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
 
         self.terminate()
         raise RuntimeError(
@@ -1,10 +1,17 @@
 """Cookie and storage state utilities for NotebookLM Automator."""
 
-import json
 import logging
+import mmap
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON for cookie and storage state files
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +21,64 @@ STORAGE_STATE_FILE = "storage_state.json"
 # CookieCloud JSON file name
 COOKIECLOUD_FILE = "cookie.json"
 
+# Auth-related environment variables, read once; see reload_env()
+_ENV_KEYS = (
+    "NOTEBOOKLM_COOKIES_FILE",
+    "COOKIECLOUD_FILE",
+    "NOTEBOOKLM_STORAGE_STATE",
+    "NOTEBOOKLM_CHROME_USER_DATA_DIR",
+)
+_ENV: Dict[str, Optional[str]] = {}
+
+
+def reload_env() -> None:
+    """Re-read the auth-related environment variables."""
+    _ENV.update({key: os.environ.get(key) for key in _ENV_KEYS})
+
+
+reload_env()
+
+# Navigate from this file to project root: core -> notebooklm_automator -> src -> project_root
+_DEFAULT_COOKIES_DIR = Path(__file__).parent.parent.parent.parent / "local" / "cookies"
+
+# Google-related cookie domains to keep ("google." also covers google.com)
+_GOOGLE_DOMAIN_RE = re.compile(r"google\.|gstatic\.com|googleapis\.com|youtube\.com")
+_GOOGLE_DOMAIN_RE_BYTES = re.compile(_GOOGLE_DOMAIN_RE.pattern.encode())
+
+# First bytes of cookies.txt lines that carry no cookie
+_SKIP_LINE_PREFIXES = (b"#", b"\n", b"\r")
+
+
+# The stdlib json fallback is imported on first use: most processes that
+# import this module (e.g. via the package) never read a JSON auth file
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    import json
+
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# CookieCloud sameSite values ("strict", "lax", "no_restriction",
+# "unspecified") mapped to Playwright's ("Strict", "Lax", "None")
+_SAMESITE_MAP = {
+    "strict": "Strict",
+    "lax": "Lax",
+    "none": "None",
+    "no_restriction": "None",
+}
+
+# Spellings of a true flag in cookies.txt; a set lookup avoids upper() per row
+_TRUE_FLAGS = frozenset({"TRUE", "True", "true"})
+
 
 def parse_cookies_txt(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -27,57 +92,67 @@ def parse_cookies_txt(file_path: str) -> List[Dict[str, Any]]:
 
     Netscape cookies.txt format (tab-separated):
         domain, include_subdomains, path, secure, expiration, name, value
-    """
-    cookies = []
-    path = Path(file_path)
 
-    if not path.exists():
+    Parsed results are cached until the file's mtime or size changes.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
         logger.warning(f"Cookies file not found: {file_path}")
         return []
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                parts = line.split("\t")
-                if len(parts) < 7:
-                    continue
+    return [dict(c) for c in _parse_cookies_txt(file_path, st.st_mtime_ns, st.st_size)]
 
-                domain, _flag, cookie_path, secure, expiration, name, value = parts[:7]
 
-                # Only include Google-related cookies
-                # Include all google.com subdomains (accounts, notebooklm, etc.)
-                if not (
-                    "google.com" in domain
-                    or "google." in domain
-                    or "gstatic.com" in domain
-                    or "googleapis.com" in domain
-                    or "youtube.com" in domain
-                ):
-                    continue
-
-                cookie = {
-                    "name": name,
-                    "value": value,
-                    "domain": domain,
-                    "path": cookie_path,
-                    "secure": secure.upper() == "TRUE",
-                    "httpOnly": False,  # Cannot be determined from cookies.txt
-                }
-
-                # Add expiration if valid (0 means session cookie)
-                try:
-                    exp = int(expiration)
-                    if exp > 0:
-                        cookie["expires"] = exp
-                except ValueError:
-                    pass
+@lru_cache(maxsize=8)
+def _parse_cookies_txt(file_path: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse a cookies.txt file; the stat fields only key the cache."""
+    cookies = []
+    path = Path(file_path)
 
-                cookies.append(cookie)
+    try:
+        # Files may hold whole browser profiles: map them and decode only the
+        # rows that are kept (mmap can't map an empty file)
+        if size:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                for raw in iter(mm.readline, b""):
+                    # Skip empty lines and comments
+                    if raw[:1] in _SKIP_LINE_PREFIXES:
+                        continue
+
+                    # Only include Google-related cookies, checked on the raw
+                    # domain column before the row is decoded
+                    # Include all google.com subdomains (accounts, notebooklm, etc.)
+                    tab = raw.find(b"\t")
+                    if tab < 0 or not _GOOGLE_DOMAIN_RE_BYTES.search(raw, 0, tab):
+                        continue
+
+                    row = raw.decode("utf-8").rstrip("\r\n").split("\t")
+                    if len(row) < 7:
+                        continue
+
+                    domain, _flag, cookie_path, secure, expiration, name, value = row[:7]
+
+                    cookie = {
+                        "name": name,
+                        "value": value,
+                        "domain": domain,
+                        "path": cookie_path,
+                        "secure": secure in _TRUE_FLAGS,
+                        "httpOnly": False,  # Cannot be determined from cookies.txt
+                    }
+
+                    # Add expiration if valid (0 means session cookie)
+                    try:
+                        exp = int(expiration)
+                        if exp > 0:
+                            cookie["expires"] = exp
+                    except ValueError:
+                        pass
+
+                    cookies.append(cookie)
 
         logger.info(f"Parsed {len(cookies)} cookies from {file_path}")
         return cookies
@@ -94,7 +169,7 @@ def has_chrome_login_state() -> bool:
     Returns:
         True if Chrome Cookies database exists, False otherwise.
     """
-    user_data_dir = os.getenv("NOTEBOOKLM_CHROME_USER_DATA_DIR")
+    user_data_dir = _ENV["NOTEBOOKLM_CHROME_USER_DATA_DIR"]
     if not user_data_dir:
         user_data_dir = str(Path.home() / ".notebooklm-chrome")
 
@@ -109,9 +184,30 @@ def has_chrome_login_state() -> bool:
 
 def get_default_cookies_dir() -> Path:
     """Get the default cookies directory path (project_root/local/cookies)."""
-    # Navigate from this file to project root: core -> notebooklm_automator -> src -> project_root
-    project_root = Path(__file__).parent.parent.parent.parent
-    return project_root / "local" / "cookies"
+    return _DEFAULT_COOKIES_DIR
+
+
+@lru_cache(maxsize=1)
+def _scan_dir(path: str, mtime_ns: int) -> FrozenSet[str]:
+    """List a directory's entry names; the mtime only keys the cache."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _in_default_dir(file_name: str) -> bool:
+    """Check whether the default cookies directory contains a file.
+
+    One stat of the directory replaces a stat per candidate file; the
+    listing is re-read only when entries are added or removed.
+    """
+    try:
+        mtime_ns = os.stat(_DEFAULT_COOKIES_DIR).st_mtime_ns
+    except OSError:
+        return False
+    return file_name in _scan_dir(str(_DEFAULT_COOKIES_DIR), mtime_ns)
 
 
 def find_cookies_file() -> Optional[str]:
@@ -124,7 +220,7 @@ def find_cookies_file() -> Optional[str]:
         Path to cookies file or None if not found.
     """
     # Priority 1: env var (from --cookies-file)
-    cookies_file = os.getenv("NOTEBOOKLM_COOKIES_FILE")
+    cookies_file = _ENV["NOTEBOOKLM_COOKIES_FILE"]
     if cookies_file:
         if Path(cookies_file).exists():
             logger.info(f"Using cookies file from argument: {cookies_file}")
@@ -134,7 +230,7 @@ def find_cookies_file() -> Optional[str]:
 
     # Priority 2: default directory
     default_file = get_default_cookies_dir() / "cookies.txt"
-    if default_file.exists():
+    if _in_default_dir(default_file.name):
         logger.info(f"Using cookies file from default location: {default_file}")
         return str(default_file)
 
@@ -193,17 +289,31 @@ def parse_cookiecloud_json(file_path: str) -> List[Dict[str, Any]]:
 
     Returns:
         List of cookie dicts in Playwright format.
-    """
-    cookies = []
-    path = Path(file_path)
 
-    if not path.exists():
+    Parsed results are cached until the file's mtime or size changes.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
         logger.warning(f"CookieCloud file not found: {file_path}")
         return []
 
+    return [
+        dict(c)
+        for c in _parse_cookiecloud_json(file_path, st.st_mtime_ns, st.st_size)
+    ]
+
+
+@lru_cache(maxsize=8)
+def _parse_cookiecloud_json(
+    file_path: str, mtime_ns: int, size: int
+) -> List[Dict[str, Any]]:
+    """Parse a CookieCloud file; the stat fields only key the cache."""
+    cookies = []
+    path = Path(file_path)
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(path.read_bytes())
 
         # CookieCloud format: array with data object
         if not isinstance(data, list) or len(data) == 0:
@@ -221,13 +331,7 @@ def parse_cookiecloud_json(file_path: str) -> List[Dict[str, Any]]:
                 domain = cc_cookie.get("domain", "")
 
                 # Only include Google-related cookies
-                if not (
-                    "google.com" in domain
-                    or "google." in domain
-                    or "gstatic.com" in domain
-                    or "googleapis.com" in domain
-                    or "youtube.com" in domain
-                ):
+                if not _GOOGLE_DOMAIN_RE.search(domain):
                     continue
 
                 # Convert to Playwright format
@@ -245,17 +349,10 @@ def parse_cookiecloud_json(file_path: str) -> List[Dict[str, Any]]:
                 if exp_date and exp_date > 0:
                     cookie["expires"] = int(exp_date)
 
-                # Handle sameSite
-                # CookieCloud uses: "strict", "lax", "no_restriction", "unspecified"
-                # Playwright expects: "Strict", "Lax", "None"
-                same_site = cc_cookie.get("sameSite", "").lower()
-                if same_site == "strict":
-                    cookie["sameSite"] = "Strict"
-                elif same_site == "lax":
-                    cookie["sameSite"] = "Lax"
-                elif same_site in ("none", "no_restriction"):
-                    cookie["sameSite"] = "None"
-                # "unspecified" -> don't set sameSite (browser default)
+                # Handle sameSite; "unspecified" -> don't set (browser default)
+                same_site = _SAMESITE_MAP.get(cc_cookie.get("sameSite", "").lower())
+                if same_site:
+                    cookie["sameSite"] = same_site
 
                 cookies.append(cookie)
 
@@ -277,7 +374,7 @@ def find_cookiecloud_file() -> Optional[str]:
         Path to cookie.json file or None if not found.
     """
     # Priority 1: env var
-    cookiecloud_file = os.getenv("COOKIECLOUD_FILE")
+    cookiecloud_file = _ENV["COOKIECLOUD_FILE"]
     if cookiecloud_file:
         if Path(cookiecloud_file).exists():
             logger.info(f"Using CookieCloud file from env: {cookiecloud_file}")
@@ -288,7 +385,7 @@ def find_cookiecloud_file() -> Optional[str]:
     # Priority 2: default directory
     default_file = get_default_cookies_dir() / COOKIECLOUD_FILE
     logger.debug(f"Checking CookieCloud file at: {default_file}")
-    if default_file.exists():
+    if _in_default_dir(default_file.name):
         logger.info(f"Using CookieCloud file from default location: {default_file}")
         return str(default_file)
 
@@ -329,20 +426,32 @@ def find_storage_state() -> Optional[str]:
         Path to storage state file or None if not found.
     """
     # Priority 1: env var
-    storage_state = os.getenv("NOTEBOOKLM_STORAGE_STATE")
+    storage_state = _ENV["NOTEBOOKLM_STORAGE_STATE"]
     if storage_state and Path(storage_state).exists():
         logger.info(f"Using storage state from env: {storage_state}")
         return storage_state
 
     # Priority 2: default directory
     default_file = get_storage_state_path()
-    if default_file.exists():
+    if _in_default_dir(default_file.name):
         logger.info(f"Using storage state from default location: {default_file}")
         return str(default_file)
 
     return None
 
 
+@lru_cache(maxsize=8)
+def _read_state_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a storage state file; the stat fields only key the cache."""
+    return _json_loads(Path(path).read_bytes())
+
+
+def _read_state_file_at(path: str) -> Dict[str, Any]:
+    """Return the cached parse of a storage state file, re-reading on change."""
+    st = os.stat(path)
+    return _read_state_file(path, st.st_mtime_ns, st.st_size)
+
+
 def load_storage_state() -> Optional[Dict[str, Any]]:
     """
     Load storage state from JSON file.
@@ -355,15 +464,19 @@ def load_storage_state() -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(storage_path, "r", encoding="utf-8") as f:
-            state = json.load(f)
-            cookie_count = len(state.get("cookies", []))
-            origin_count = len(state.get("origins", []))
-            logger.info(
-                f"Loaded storage state: {cookie_count} cookies, "
-                f"{origin_count} origins"
-            )
-            return state
+        state = _read_state_file_at(storage_path)
+        cookie_count = len(state.get("cookies", []))
+        origin_count = len(state.get("origins", []))
+        logger.info(
+            f"Loaded storage state: {cookie_count} cookies, "
+            f"{origin_count} origins"
+        )
+        # Copy so callers can't modify the cached state
+        return {
+            **state,
+            "cookies": [dict(c) for c in state.get("cookies", [])],
+            "origins": [dict(o) for o in state.get("origins", [])],
+        }
     except Exception as e:
         logger.warning(f"Failed to load storage state: {e}")
         return None
@@ -389,8 +502,7 @@ def save_storage_state(state: Dict[str, Any], path: Optional[str] = None) -> boo
         # Ensure directory exists
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        save_path.write_bytes(_json_dumps(state))
 
         cookie_count = len(state.get("cookies", []))
         logger.info(f"Saved storage state ({cookie_count} cookies) to {save_path}")
@@ -447,3 +559,24 @@ def get_auth_state() -> Optional[Union[str, Dict[str, Any]]]:
 
     logger.warning("No auth source found (storage_state.json, cookie.json, or cookies.txt)")
     return None
+
+
+def load_auth_state() -> Optional[Dict[str, Any]]:
+    """
+    Resolve the authentication state via get_auth_state() as a dict.
+
+    Storage state files are parsed once and reused until they change on disk.
+    The returned dict may be shared between calls and must not be mutated.
+
+    Returns:
+        Storage state dict, or None if no auth source was found.
+    """
+    auth_state = get_auth_state()
+    if not isinstance(auth_state, str):
+        return auth_state
+
+    try:
+        return _read_state_file_at(auth_state)
+    except Exception as e:
+        logger.warning(f"Failed to load storage state: {e}")
+        return None
@@ -1,8 +1,9 @@
 """UI selectors and translations for NotebookLM Automator."""
 
 from collections import defaultdict
+from functools import lru_cache
 from types import MappingProxyType
-from typing import Dict, Final, Mapping, Optional
+from typing import Callable, Dict, Final, Mapping, Optional
 
 DEFAULT_LANGUAGE: Final[str] = "en"
 LANGUAGE_ALIASES: Final[Mapping[str, str]] = MappingProxyType({"iw": "he"})
@@ -62,6 +63,15 @@ def _normalize_language(language: str) -> str:
     return LANGUAGE_ALIASES.get(language, language)
 
 
+@lru_cache(maxsize=None)
+def _resolve_language(language: str) -> Dict[str, str]:
+    """Resolve every selector key for a language, with English fallback."""
+    normalized = _normalize_language(language)
+    default_map = _LANGUAGE_MAP[DEFAULT_LANGUAGE]
+    lang_map = _LANGUAGE_MAP.get(normalized) or default_map
+    return {key: lang_map.get(key, default_map.get(key)) for key in _SELECTORS_BY_KEY}
+
+
 def get_selectors() -> SelectorsByLanguage:
     """
     Return a dictionary of selectors and text for different languages.
@@ -73,6 +83,14 @@ def get_selectors() -> SelectorsByLanguage:
 
 def get_selector_by_language(language: str, key: str) -> Optional[str]:
     """Get a selector value for a specific language with fallback to English."""
-    normalized = _normalize_language(language)
-    lang_map = _LANGUAGE_MAP.get(normalized) or _LANGUAGE_MAP[DEFAULT_LANGUAGE]
-    return lang_map.get(key, _LANGUAGE_MAP[DEFAULT_LANGUAGE].get(key))
+    return _resolve_language(language).get(key)
+
+
+def make_selector_getter(language: str) -> Callable[[str], Optional[str]]:
+    """Return a selector lookup specialized for one language.
+
+    The language is normalized and resolved once; the returned function is
+    the bound ``get`` of that language's resolved dict, so each lookup is a
+    single dict access with English fallback already baked in.
+    """
+    return _resolve_language(language).get
@@ -1,31 +1,45 @@
 """Source management operations for NotebookLM Automator."""
 
 import logging
-from typing import Any, Callable, Dict, List, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page
+    from playwright.sync_api import Locator, Page
 
 logger = logging.getLogger(__name__)
 
+# Localized labels SourceManager looks up
+_LABEL_KEYS = (
+    "add_source_button",
+    "sources_tab",
+    "insert_button",
+    "source_type_youtube",
+    "source_type_website",
+    "source_type_text",
+    "url_input_placeholder",
+    "delete_source_menu_item",
+    "confirm_delete_button",
+)
+
 
 def group_sources(sources: List[Dict[str, str]]) -> List[Dict[str, str]]:
     """Group URL and YouTube sources together into a single item with newlines."""
-    url_like_types = {"url", "youtube"}
-    url_like_sources = [
-        source for source in sources if source.get("type") in url_like_types
-    ]
-    other_sources = [
-        source for source in sources if source.get("type") not in url_like_types
-    ]
+    url_like_types = ("url", "youtube")
+    url_like_contents: List[str] = []
+    join_type = None
+    other_sources = []
+    for source in sources:
+        source_type = source.get("type")
+        if source_type in url_like_types:
+            url_like_contents.append(source.get("content", ""))
+            if join_type is None:
+                join_type = source_type
+        else:
+            other_sources.append(source)
 
     new_sources = []
-    if url_like_sources:
-        joined_content = "\n".join(
-            source.get("content", "") for source in url_like_sources
-        )
-        join_type = url_like_sources[0].get("type", "url")
-        new_sources.append({"type": join_type, "content": joined_content})
+    if url_like_contents:
+        new_sources.append({"type": join_type, "content": "\n".join(url_like_contents)})
     new_sources.extend(other_sources)
     return new_sources
 
@@ -36,45 +50,129 @@ class SourceManager:
     def __init__(self, page: "Page", get_text: Callable[[str], str]):
         self.page = page
         self._get_text = get_text
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """(Re)build the cached locators, e.g. after the page navigated.
+
+        Locators are lazy queries, so they stay valid across DOM updates;
+        this only needs to be called when the page or language changes.
+        """
+        page = self.page
+        # Translations are fixed for the lifetime of the manager
+        labels = self._labels = {key: self._get_text(key) for key in _LABEL_KEYS}
+        chip_selector = "mat-chip-option, .mdc-evolution-chip, span.mat-mdc-chip-action"
+
+        self._source_items = page.locator("div.single-source-container")
+        self._dialog = page.locator("mat-dialog-container").last
+        self._add_button = page.locator(
+            f"button:has-text('{labels['add_source_button']}')"
+        ).first
+        self._add_button_text = page.get_by_text(
+            labels["add_source_button"], exact=False
+        ).first
+        self._close_button = page.locator(
+            "button:has(mat-icon:has-text('close'))"
+        ).first
+        self._close_icon = page.locator("mat-icon", has_text="close").first
+        self._url_input = page.locator("textarea[formcontrolname='newUrl']").first
+        self._url_input_fallback = page.locator(
+            "input[type='url'], input[placeholder*='http'], textarea[placeholder*='http'],"
+        ).first
+        text_selector = (
+            "textarea[formcontrolname='textInput'], "
+            "textarea[formcontrolname='newText'], "
+            "textarea"
+        )
+        self._dialog_textarea = self._dialog.locator(text_selector).first
+        self._page_textarea = page.locator(text_selector).first
+
+        # CSS locators resolve faster than role queries, which match on the
+        # accessible name of every element; the role variants are fallbacks
+        insert_text = labels["insert_button"]
+        self._insert_button = self._dialog.locator(
+            f"button:has-text('{insert_text}')"
+        ).first
+        self._insert_button_role = page.get_by_role("button", name=insert_text).first
+        delete_text = labels["delete_source_menu_item"]
+        self._delete_menu_item = page.locator(
+            f"[role='menuitem']:has-text('{delete_text}')"
+        ).first
+        self._delete_menu_item_role = page.get_by_role("menuitem", name=delete_text).first
+        confirm_text = labels["confirm_delete_button"]
+        self._confirm_button = self._dialog.locator(
+            f"button:has-text('{confirm_text}')"
+        ).first
+        self._confirm_button_role = page.get_by_role("button", name=confirm_text).first
+
+        # Chip and exact-text fallback per source type
+        self._chips: Dict[str, Tuple["Locator", "Locator"]] = {}
+        for source_type, key in (
+            ("url", "source_type_website"),
+            ("youtube", "source_type_youtube"),
+            ("text", "source_type_text"),
+        ):
+            type_text = labels[key]
+            if type_text:
+                self._chips[source_type] = (
+                    page.locator(chip_selector, has_text=type_text).first,
+                    page.get_by_text(type_text, exact=True).first,
+                )
+
+    @staticmethod
+    def _wait_for_state(locator, state: str, timeout: float) -> bool:
+        """Wait for a locator to reach a state; return False on timeout."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            locator.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    @staticmethod
+    def _css_or_role(css: "Locator", role: "Locator") -> "Locator":
+        """Return the CSS locator, or the role locator if CSS matches nothing."""
+        return css if css.count() > 0 else role
 
     def _ensure_sources_tab(self) -> None:
         """Switch to Sources tab if source elements are not visible (tab mode)."""
-        # Check if sources panel is visible
-        source_items = self.page.locator("div.single-source-container")
-        add_btn = self.page.get_by_text(self._get_text("add_source_button"), exact=False).first
+        # Check if sources panel is visible; is_visible() is simply False
+        # when nothing matches, so no separate count() round-trip is needed
+        source_items = self._source_items
+        add_btn = self._add_button_text
 
-        if source_items.count() > 0 or (add_btn.count() > 0 and add_btn.is_visible()):
+        if source_items.count() > 0 or add_btn.is_visible():
             return  # Already in full layout or Sources tab
 
         # Close any open dialog that might block tab clicks
         self.close_dialog()
 
         # Try to click Sources tab using Angular Material tab selector
-        sources_text = self._get_text("sources_tab")
+        sources_text = self._labels["sources_tab"]
         # Priority 1: mat-tab-label with text (Angular Material tabs)
         sources_tab = self.page.locator(
             f".mat-mdc-tab:has-text('{sources_text}'), "
             f".mat-tab-label:has-text('{sources_text}'), "
             f"[role='tab']:has-text('{sources_text}')"
         ).first
-        if sources_tab.count() > 0 and sources_tab.is_visible():
+        if sources_tab.is_visible():
             logger.info("Switching to Sources tab...")
             sources_tab.click()
-            self.page.wait_for_timeout(500)
+            self._wait_for_state(add_btn, "visible", 2000)
             return
 
         # Priority 2: fallback to text matching
         sources_tab = self.page.get_by_text(sources_text, exact=True).first
-        if sources_tab.count() > 0 and sources_tab.is_visible():
+        if sources_tab.is_visible():
             logger.info("Switching to Sources tab (text match)...")
             sources_tab.click()
-            self.page.wait_for_timeout(500)
+            self._wait_for_state(add_btn, "visible", 2000)
 
     def is_dialog_open(self) -> bool:
         """Check if the add source dialog is open."""
         try:
-            dialog = self.page.locator("mat-dialog-container").last
-            return dialog.is_visible()
+            return self._dialog.is_visible()
         except Exception:
             return False
 
@@ -83,78 +181,66 @@ class SourceManager:
         if self.is_dialog_open():
             return
 
-        add_button = self.page.locator(
-            f"button:has-text('{self._get_text('add_source_button')}')"
-        ).first
-        if add_button.count() == 0 or not add_button.is_visible():
+        add_button = self._add_button
+        if not self._wait_for_state(add_button, "visible", 2000):
             raise RuntimeError("Could not locate the 'Add source' button")
 
         add_button.click()
-        self.page.wait_for_timeout(500)
+        self._wait_for_state(self._dialog, "visible", 2000)
 
     def close_dialog(self) -> None:
         """Close the add source dialog if open."""
         if not self.is_dialog_open():
             return
 
-        close_button = self.page.locator(
-            "button:has(mat-icon:has-text('close'))"
-        ).first
-        if close_button.count() > 0 and close_button.is_visible():
+        close_button = self._close_button
+        if close_button.is_visible():
             close_button.click()
-            self.page.wait_for_timeout(200)
-            return
-
-        close_icon = self.page.locator("mat-icon", has_text="close").first
-        if close_icon.count() > 0 and close_icon.is_visible():
+        else:
+            close_icon = self._close_icon
+            if not close_icon.is_visible():
+                return
             close_icon.click()
-            self.page.wait_for_timeout(200)
+
+        self._wait_for_state(self._dialog, "hidden", 1000)
 
     def add_url(self, source_type: str, url: str) -> None:
         """Add a URL or YouTube source."""
         self.open_dialog()
         try:
-            type_text = self._get_text(
-                "source_type_youtube" if source_type == "youtube" else "source_type_website"
-            )
-            if type_text:
-                chip = self.page.locator(
-                    "mat-chip-option, .mdc-evolution-chip, span.mat-mdc-chip-action",
-                    has_text=type_text
-                ).first
-                if chip.count() > 0 and chip.is_visible():
+            chips = self._chips.get("youtube" if source_type == "youtube" else "url")
+            if chips:
+                chip, chip_text = chips
+                if chip.is_visible():
                     chip.click()
-                else:
-                    chip = self.page.get_by_text(type_text, exact=True).first
-                    if chip.count() > 0 and chip.is_visible():
-                        chip.click()
-
-            inp = self.page.locator("textarea[formcontrolname='newUrl']").first
-            if inp.count() == 0 or not inp.is_visible():
-                inp = self.page.locator(
-                    "input[type='url'], input[placeholder*='http'], textarea[placeholder*='http'],"
-                ).first
-
-            if inp.count() == 0 or not inp.is_visible():
-                placeholder = self._get_text("url_input_placeholder")
+                elif chip_text.is_visible():
+                    chip_text.click()
+
+            inp = self._url_input
+            if not inp.is_visible():
+                inp = self._url_input_fallback
+
+            if not inp.is_visible():
+                placeholder = self._labels["url_input_placeholder"]
                 if placeholder:
                     inp = self.page.get_by_placeholder(placeholder, exact=False).first
 
-            if inp.count() == 0 or not inp.is_visible():
+            if not inp.is_visible():
                 raise RuntimeError(f"Could not find URL input field for {source_type}")
 
+            # click() waits for Insert to become enabled after the fill
             inp.fill(url)
-            self.page.wait_for_timeout(500)
 
-            insert_text = self._get_text("insert_button")
-            insert_btn = self.page.get_by_role("button", name=insert_text).first
-
-            if insert_btn.count() > 0 and insert_btn.is_visible():
+            insert_btn = self._css_or_role(
+                self._insert_button, self._insert_button_role
+            )
+            if insert_btn.is_visible():
                 insert_btn.click()
             else:
                 inp.press("Enter")
 
-            self.page.wait_for_timeout(100)
+            # Inserting closes the dialog once the source is accepted
+            self._wait_for_state(inp, "hidden", 2000)
         finally:
             self.close_dialog()
 
@@ -162,50 +248,47 @@ class SourceManager:
         """Add a text source via the 'Copied text' option."""
         self.open_dialog()
         try:
-            type_text = self._get_text("source_type_text")
             chip = None
-            if type_text:
-                chip = self.page.locator(
-                    "mat-chip-option, .mdc-evolution-chip, span.mat-mdc-chip-action",
-                    has_text=type_text
-                ).first
-                if chip.count() == 0 or not chip.is_visible():
-                    chip = self.page.get_by_text(type_text, exact=True).first
-            if chip and chip.count() > 0 and chip.is_visible():
+            chips = self._chips.get("text")
+            if chips:
+                chip, chip_text = chips
+                if not chip.is_visible():
+                    chip = chip_text
+            if chip and chip.is_visible():
                 chip.click()
 
-            dialog = self.page.locator("mat-dialog-container").last
-            if not dialog or dialog.count() == 0 or not dialog.is_visible():
-                dialog = self.page
-
-            textarea = dialog.locator(
-                "textarea[formcontrolname='textInput'], "
-                "textarea[formcontrolname='newText'], "
-                "textarea"
-            ).first
+            dialog = self._dialog
+            if not dialog.is_visible():
+                textarea = self._page_textarea
+            else:
+                textarea = self._dialog_textarea
 
-            if textarea.count() == 0 or not textarea.is_visible():
+            if not self._wait_for_state(textarea, "visible", 2000):
                 raise RuntimeError(
                     "Could not find text input field for copied text source"
                 )
 
+            # click() waits for Insert to become enabled after the fill
             textarea.fill(text_content)
-            self.page.wait_for_timeout(500)
-
-            insert_text = self._get_text("insert_button")
-            insert_btn = self.page.get_by_role("button", name=insert_text).first
 
-            if insert_btn.count() > 0 and insert_btn.is_visible():
+            insert_btn = self._css_or_role(
+                self._insert_button, self._insert_button_role
+            )
+            if insert_btn.is_visible():
                 insert_btn.click()
             else:
                 textarea.press("Enter")
 
-            self.page.wait_for_timeout(100)
+            # Inserting closes the dialog once the source is accepted
+            self._wait_for_state(textarea, "hidden", 2000)
         finally:
             self.close_dialog()
 
     def add_sources(self, sources: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Add multiple sources to the notebook."""
+        if not sources:
+            return []
+
         self._ensure_sources_tab()
         self.close_dialog()
         results = []
@@ -230,7 +313,6 @@ class SourceManager:
                 result["error"] = str(e)
 
             results.append(result)
-            self.page.wait_for_timeout(100)
 
         return results
 
@@ -239,45 +321,54 @@ class SourceManager:
         self._ensure_sources_tab()
 
         removed = 0
-
-        def get_source_items():
-            return self.page.locator("div.single-source-container")
-
         max_attempts = 200
+        handles = []
+        fresh = False
         for _ in range(max_attempts):
-            source_items = get_source_items()
-            if source_items.count() == 0:
-                break
+            if not handles:
+                # Resolve all source items in one round-trip; only re-query
+                # once the batch is used up or a handle turns out to be stale
+                handles = self._source_items.element_handles()
+                if not handles:
+                    break
+                fresh = True
 
-            source = source_items.first
+            # Only the first item of a new batch is known to be current;
+            # the list may re-render after each delete
+            source = handles.pop(0)
+            is_fresh, fresh = fresh, False
             try:
-                more_button = source.locator("button.source-item-more-button").first
-                if more_button.count() == 0 or not more_button.is_visible():
-                    more_button = source.locator(
+                more_button = source.query_selector("button.source-item-more-button")
+                if more_button is None or not more_button.is_visible():
+                    more_button = source.query_selector(
                         "button:has(mat-icon:has-text('more_vert'))"
-                    ).first
+                    )
 
-                if more_button.count() == 0 or not more_button.is_visible():
-                    logger.warning("Could not locate 'more' button for a source item.")
-                    break
+                if more_button is None or not more_button.is_visible():
+                    raise RuntimeError("'more' button not found")
 
                 more_button.click()
-                self.page.wait_for_timeout(200)
+            except Exception as e:
+                if not is_fresh:
+                    handles = []
+                    continue
+                logger.warning(f"Could not open the menu for a source item: {e}")
+                break
 
-                delete_text = self._get_text("delete_source_menu_item")
-                menu_item = self.page.get_by_role("menuitem", name=delete_text).first
-                if menu_item.count() > 0 and menu_item.is_visible():
+            try:
+                menu_item = self._delete_menu_item
+                if not self._wait_for_state(menu_item, "visible", 2000):
+                    menu_item = self._delete_menu_item_role
+                if menu_item.is_visible():
                     menu_item.click()
                 else:
                     logger.warning("Could not find 'Remove source' menu item.")
                     break
-                self.page.wait_for_timeout(200)
 
-                confirm_text = self._get_text("confirm_delete_button")
-                confirm_button = self.page.get_by_role(
-                    "button", name=confirm_text
-                ).first
-                if confirm_button.count() > 0 and confirm_button.is_visible():
+                confirm_button = self._confirm_button
+                if not self._wait_for_state(confirm_button, "visible", 2000):
+                    confirm_button = self._confirm_button_role
+                if confirm_button.is_visible():
                     confirm_button.click()
                 else:
                     logger.warning(
@@ -286,14 +377,16 @@ class SourceManager:
                     break
 
                 try:
-                    source.wait_for(state="detached", timeout=1000)
+                    # The handle pins this item, so this no longer waits for
+                    # the next source to go away; "hidden" covers detached
+                    source.wait_for_element_state("hidden", timeout=1000)
                 except Exception:
                     logger.warning(
                         "Source item did not disappear after delete confirmation."
                     )
+                    handles = []
 
                 removed += 1
-                self.page.wait_for_timeout(500)
             except Exception as e:
                 logger.error(f"Failed to remove a source: {e}")
                 break
@@ -3,6 +3,8 @@ import os
 import argparse
 from dotenv import load_dotenv
 
+from notebooklm_automator.core.automator import NotebookLMAutomator
+
 def main():
     parser = argparse.ArgumentParser(description="Start the NotebookLM Automator API server.")
     parser.add_argument("--port", type=int, default=8000, help="API server port")
@@ -10,6 +12,7 @@ def main():
     parser.add_argument("--notebook-url", type=str, help="NotebookLM Notebook URL (overrides NOTEBOOKLM_URL env var)")
     parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode (no GUI)")
     parser.add_argument("--cookies-file", type=str, help="Path to cookies.txt file for auto-login (Netscape format)")
+    parser.add_argument("--reload", action=argparse.BooleanOptionalAction, default=False, help="Restart the server on code changes (development only)")
 
     args = parser.parse_args()
 
@@ -25,6 +28,10 @@ def main():
     if args.cookies_file:
         os.environ["NOTEBOOKLM_COOKIES_FILE"] = args.cookies_file
 
+    # Importing this module already cached the automator's environment
+    # settings; pick up .env and the arguments above
+    NotebookLMAutomator.reload_env()
+
     if not os.getenv("NOTEBOOKLM_URL"):
         print("Error: NOTEBOOKLM_URL environment variable or argument is required.")
         return
@@ -32,7 +39,13 @@ def main():
     headless_mode = "headless" if args.headless else "GUI"
     print(f"Starting API server for notebook: {os.getenv('NOTEBOOKLM_URL')} ({headless_mode} mode)")
 
-    uvicorn.run("notebooklm_automator.api.app:app", host=args.host, port=args.port, reload=True)
+    if args.reload:
+        # The reloader needs an import string to re-import the app in its worker
+        uvicorn.run("notebooklm_automator.api.app:app", host=args.host, port=args.port, reload=True)
+    else:
+        from notebooklm_automator.api.app import app
+
+        uvicorn.run(app, host=args.host, port=args.port)
 
 if __name__ == "__main__":
     main()
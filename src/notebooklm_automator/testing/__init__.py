@@ -0,0 +1,5 @@
+"""Test-suite helpers shared by the CLI runner and the API."""
+
+from notebooklm_automator.testing.paths import TEST_PATHS, TestType
+
+__all__ = ["TEST_PATHS", "TestType"]
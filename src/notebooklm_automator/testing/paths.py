@@ -0,0 +1,25 @@
+"""Test type to directory mapping."""
+
+from enum import Enum
+from types import MappingProxyType
+from typing import Mapping
+
+
+class TestType(str, Enum):
+    # Keep pytest from collecting this as a test class when it is imported
+    __test__ = False
+
+    UNIT = "unit"
+    API = "api"
+    UI = "ui"
+    E2E = "e2e"
+    ALL = "all"
+
+
+TEST_PATHS: Mapping[TestType, str] = MappingProxyType({
+    TestType.UNIT: "tests/unit/",
+    TestType.API: "tests/api/",
+    TestType.UI: "tests/ui/",
+    TestType.E2E: "tests/e2e/",
+    TestType.ALL: "tests/",
+})
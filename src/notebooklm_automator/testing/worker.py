@@ -0,0 +1,24 @@
+"""Pre-warmed pytest process used by the /run-tests endpoint.
+
+The API starts this module before a run is requested, so interpreter start-up
+and the pytest import are already paid for when one arrives. It then reads
+the pytest arguments as a single JSON line from stdin, runs them once and
+exits, so every run still gets a fresh process.
+"""
+
+import json
+import sys
+
+import pytest
+
+
+def main() -> int:
+    line = sys.stdin.readline()
+    if not line:
+        # Stdin closed without a run, e.g. the API is shutting down
+        return 0
+    return int(pytest.main(json.loads(line)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
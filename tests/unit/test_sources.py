@@ -0,0 +1,44 @@
+"""Unit tests for source grouping."""
+
+from notebooklm_automator.core.sources import group_sources
+
+
+class TestGroupSources:
+    def test_mixed_url_and_youtube_share_one_item(self):
+        sources = [
+            {"type": "youtube", "content": "https://youtu.be/a"},
+            {"type": "text", "content": "notes"},
+            {"type": "url", "content": "https://example.com"},
+            {"type": "youtube", "content": "https://youtu.be/b"},
+        ]
+
+        assert group_sources(sources) == [
+            {
+                "type": "youtube",
+                "content": "https://youtu.be/a\nhttps://example.com\nhttps://youtu.be/b",
+            },
+            {"type": "text", "content": "notes"},
+        ]
+
+    def test_type_follows_first_url_like_source(self):
+        sources = [
+            {"type": "url", "content": "https://example.com"},
+            {"type": "youtube", "content": "https://youtu.be/a"},
+        ]
+
+        grouped = group_sources(sources)
+
+        assert len(grouped) == 1
+        assert grouped[0]["type"] == "url"
+        assert grouped[0]["content"] == "https://example.com\nhttps://youtu.be/a"
+
+    def test_other_sources_keep_their_order(self):
+        sources = [
+            {"type": "text", "content": "first"},
+            {"type": "text", "content": "second"},
+        ]
+
+        assert group_sources(sources) == sources
+
+    def test_empty_list(self):
+        assert group_sources([]) == []